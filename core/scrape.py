@@ -1,23 +1,32 @@
+import atexit
 import csv
+import json
 import logging
-import math
 import os
-import pickle
 import re
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from logging import Logger
-from logging.handlers import QueueHandler
+from logging.handlers import MemoryHandler, QueueHandler, RotatingFileHandler
 from typing import List, Tuple, Union
 
 import beepy
 import yaml
-from dateutil.relativedelta import relativedelta
-from playwright.sync_api import Locator, Page, Playwright, expect
+from playwright.sync_api import Locator, Page, Playwright, expect, sync_playwright
 
 from core.data_models import Input, StopCritera
+from core.parsing import (
+    _RE_IMG_RES_DIALOG,
+    _RE_WS,
+    _validate,
+    dialog_box_parse_review_rating_tags,
+    parse_review_blob,
+    transform_date,
+)
 from core.utils.playwright import is_the_element_visible
 
 DT = ""
@@ -28,19 +37,340 @@ else:
 
 LOCAL_OUTPUT_PATH = "{output_dir}/{entity_name}_" + DT
 
+# The run timestamp is re-captured by load_config at scrape start, so a
+# long-lived process does not stamp every scrape's output directory with the
+# import-time clock
+_OUTPUT_PATH_TEMPLATE = "{output_dir}/{entity_name}_{run_ts}"
+
+# Extracts every raw field of a full-screen review object with a single
+# evaluate() round-trip instead of 10+ locator RPCs per review. The XPaths
+# mirror the ones the locator-based code used (note the leading '.' so the
+# queries stay relative to the review div - Playwright does that implicitly
+# for '//' but document.evaluate does not). All parsing/cleanup of the
+# returned strings stays on the Python side
+_JS_EXTRACT_REVIEW = """
+(el) => {
+    const first = (xp, ctx) =>
+        document.evaluate(xp, ctx || el, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const all = (xp, ctx) => {
+        const it = document.evaluate(xp, ctx || el, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < it.snapshotLength; i++) nodes.push(it.snapshotItem(i));
+        return nodes;
+    };
+
+    const res = {
+        is_google: false,
+        name: null,
+        user_profile: null,
+        rating: null,
+        review_texts: [],
+        date_text: null,
+        stay_type: null,
+        image_srcs: [],
+        full_text: el.innerText,
+    };
+
+    const gLink = first("div[1]/div/span/a");
+    if (gLink) {
+        // review posted on google
+        res.is_google = true;
+        res.name = gLink.innerText;
+        res.user_profile = gLink.getAttribute("href");
+        let r = first(".//div[contains(., '/5')][not(.//div[contains(., '/5')])]");
+        if (!r || !r.innerText.includes("/5"))
+            r = first("div/div[2][contains(., '/5')]");
+        res.rating = r ? r.innerText : null;
+    } else {
+        // review fetched from another website e.g. priceline
+        const nameEl = first("div[1]/div/span/span[1]");
+        res.name = nameEl ? nameEl.innerText : null;
+        const prof = first("div[1]/div/span/span[2]/a");
+        res.user_profile = prof ? prof.getAttribute("href") : null;
+        let r = first(".//div[contains(., '/10')][not(.//div[contains(., '/10')])]");
+        if (!r || !r.innerText.includes("/10"))
+            r = first("div/div[2][contains(., '/10')]");
+        res.rating = r ? r.innerText : null;
+    }
+
+    res.review_texts = all(
+        "div[2]//span[normalize-space() != 'Business' and normalize-space() != 'Vacation'" +
+        " and normalize-space() != 'Family' and normalize-space() != 'Friends'" +
+        " and normalize-space() != 'Couple' and normalize-space() != 'Solo'" +
+        " and not(contains(., ' \\u2758 ')) and not(contains(., 'Read more'))" +
+        " and not(contains(., 'Report review')) and not(.//svg)][not(.//span/span)]" +
+        " | div[2]//p[not(contains(., ' \\u2758 ')) and not(contains(., 'Read more'))" +
+        " and not(contains(., 'Report review')) and not(.//svg)][not(.//p/span)]"
+    ).map((n) => n.innerText);
+
+    const dtOn = first(".//span[contains(., 'ago on')][not(.//span[contains(., 'ago on')])]");
+    if (dtOn) {
+        res.date_text = dtOn.innerText;
+    } else {
+        const dt = first(".//span[contains(., ' ago')][not(.//span[contains(., ' ago')])]");
+        res.date_text = dt ? dt.innerText : null;
+    }
+
+    const st = first("div[2]/div/span");
+    res.stay_type = st ? st.innerText : null;
+
+    res.image_srcs = all("div[2]//img[contains(@alt, 'Photo')]")
+        .map((img) => img.getAttribute("src") || img.getAttribute("data-src"))
+        .filter(Boolean);
+
+    return res;
+}
+"""
+
+# Resolves the stay-type / review-text layout of a dialog-box review section
+# with one round-trip. Mirrors the branch logic of review_rating_stay_type:
+# three child divs mean stay type + review text, two mean either one alone
+_JS_REVIEW_SECTIONS = """
+(el, xp) => {
+    const first = (p) =>
+        document.evaluate(p, el, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const root = first(xp);
+    const res = { n_sections: 0, stay_type: null, review: null };
+    if (!root) return res;
+    // only div children count as sections - the locator probes this
+    // replaced queried xpath div[n], and a stray span/svg child would
+    // otherwise shift the 2-/3-section branch onto the wrong div
+    res.n_sections = [...root.children].filter(c => c.tagName === 'DIV').length;
+    if (res.n_sections > 2) {
+        const r = first(xp + "/div[2]/span/span/span") || first(xp + "/div[2]/span/span");
+        res.review = r ? r.textContent : null;
+        const s = first(xp + "/div[1]");
+        res.stay_type = s ? s.textContent : null;
+    } else if (res.n_sections > 1) {
+        const r = first(xp + "/div[1]/span/span/span") || first(xp + "/div[1]/span/span");
+        if (r) {
+            res.review = r.textContent;
+        } else {
+            const s = first(xp + "/div[1]");
+            res.stay_type = s ? s.textContent : null;
+        }
+    }
+    return res;
+}
+"""
+
+# fetches all five star-bucket aria-labels in one round-trip
+_JS_STAR_RATINGS = """
+() => {
+    const out = {};
+    for (const s of ["5", "4", "3", "2", "1"]) {
+        const el = document.evaluate(
+            `//div[contains(@aria-label, '${s}-star reviews') and @role='text']`,
+            document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        out[s] = el ? el.getAttribute("aria-label") : null;
+    }
+    return out;
+}
+"""
+
+# sort option -> (data-value, aria-selected, aria-label) of the entry in the
+# full-screen "Review Sort Options" listbox
+_SORT_OPTS_FULL = {
+    "most_helpful": ("1", "true", "Most helpful"),
+    "most_recent": ("2", "false", "Most recent"),
+    "highest_score": ("3", "false", "Highest score"),
+    "lowest_score": ("4", "false", "Lowest score"),
+}
+
+# sort option -> menu-item label of the dialog-box sort dropdown
+_SORT_LABELS_DIALOG = {
+    "most_helpful": "Most relevant",
+    "most_recent": "Newest",
+    "highest_score": "Highest rating",
+    "lowest_score": "Lowest rating",
+}
+
+# Static selectors used inside the per-review dialog-box loop. Hoisted so the
+# loop does no per-iteration string building and every call passes the
+# identical string, which lets Playwright's internal selector cache hit
+_XPATH_GOOGLE_MARKER = "xpath=div[1]"
+_XPATH_NAME_GOOGLE = "xpath=div[1]/div/div/a"
+_XPATH_RATING_GOOGLE = "xpath=div[1]/span"
+_XPATH_REVIEW_SECS = "xpath=div[1]/div[3]/div/div[1]"
+_XPATH_REVIEW_SECS_ORIG = "xpath=div[1]/div[3]/div/div[2]"
+_XPATH_DATE_AGO = "xpath=//span[contains(., ' ago')][not(.//span[contains(., ' ago')])]"
+_XPATH_CAROUSEL = "xpath=div[2]/g-scrolling-carousel"
+_XPATH_PHOTOS = "xpath=//div[@aria-label = 'Photos']"
+
+# fixed wrapper around photo URLs in the style attribute
+_BG_URL_PREFIX = "background-image:url("
+_XPATH_NAME_OTHER = "xpath=a/div[1]/span[1]"
+_XPATH_DATE_OTHER = "xpath=a/div[1]/span[2]"
+_XPATH_RATING_OTHER = "xpath=a/span"
+_XPATH_REVIEW_OTHER = "xpath=a/div[2]"
+
+# cookies/preferences persisted across runs so language and consent setup is
+# only ever done once per machine
+_STORAGE_STATE_PATH = "gscrape_state.json"
+
+# long-lived Playwright/browser pair shared across scrape calls. Chromium
+# launch is the most expensive single step of a run (1-2s), so callers that
+# scrape repeatedly reuse one browser and only pay per-call context cost
+_PLAYWRIGHT = None
+_BROWSER = None
+
+
+def get_shared_browser():
+    """Returns a lazily started browser that survives across scrape calls.
+
+    Pass the result as the 'browser' argument of the execute_* methods (or
+    run_as_module) to skip the Chromium cold start on every call. The
+    browser is closed automatically at interpreter exit.
+    """
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is None or not _BROWSER.is_connected():
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = sync_playwright().start()
+            atexit.register(_close_shared_browser)
+        _BROWSER = _PLAYWRIGHT.chromium.launch(
+            headless=False, args=["--start-maximized"]
+        )
+    return _BROWSER
+
+
+def _close_shared_browser():
+    global _PLAYWRIGHT, _BROWSER
+    try:
+        if _BROWSER is not None and _BROWSER.is_connected():
+            _BROWSER.close()
+    finally:
+        _BROWSER = None
+        if _PLAYWRIGHT is not None:
+            _PLAYWRIGHT.stop()
+            _PLAYWRIGHT = None
+
 logger: Logger
 
 
+# persisted state older than this is ignored so stale consent/session
+# cookies cannot poison every following run
+_STORAGE_STATE_MAX_AGE_S = 30 * 86400
+
+# Resource types that never contribute to the scraped text. The parsers read
+# image URLs from src/style attributes, which are present whether or not the
+# bytes behind them load, so aborting the downloads is safe. Stylesheets are
+# deliberately not blocked: the flows rely on is_visible(), which depends on
+# computed styles
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# telemetry hosts with no bearing on page content
+_RE_BLOCKED_HOSTS = re.compile(
+    r"googletagmanager\.com|google-analytics\.com|doubleclick\.net"
+)
+
+
+def _route_filter(route):
+    """Aborts requests for bytes the scraper never looks at"""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _RE_BLOCKED_HOSTS.search(
+        request.url
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _new_context(browser):
+    """Creates a browser context that reuses state persisted by earlier runs.
+
+    With locale en-US plus the stored cookies Google remembers the English
+    preference, so the 'Change to English' button never shows up and its
+    probe only costs its bounded wait. A state file older than a month is
+    treated as absent and rewritten by the next run.
+    """
+    try:
+        fresh = (
+            time.time() - os.path.getmtime(_STORAGE_STATE_PATH)
+            < _STORAGE_STATE_MAX_AGE_S
+        )
+    except OSError:
+        fresh = False
+    context = None
+    if fresh:
+        try:
+            context = browser.new_context(
+                storage_state=_STORAGE_STATE_PATH, locale="en-US"
+            )
+        except Exception as ex:
+            # a corrupt state file must not fail every scrape until someone
+            # deletes it by hand; start fresh and let the next persist
+            # overwrite it
+            logger.warning(f"Could not load browser storage state: {ex}")
+    if context is None:
+        context = browser.new_context(locale="en-US")
+    # drop images/fonts/media and telemetry at the context level
+    context.route("**/*", _route_filter)
+    return context
+
+
+def _persist_storage_state(context):
+    """Saves the context's cookies/preferences for the next run.
+
+    The state is written to a temp file and renamed into place under
+    _DISK_LOCK so concurrent scrape_many workers cannot interleave writes
+    and corrupt the file
+    """
+    try:
+        state = context.storage_state()
+        tmp_path = f"{_STORAGE_STATE_PATH}.tmp"
+        with _DISK_LOCK:
+            with open(tmp_path, "w") as fh:
+                json.dump(state, fh)
+            os.replace(tmp_path, _STORAGE_STATE_PATH)
+    except Exception as ex:
+        logger.warning(f"Could not persist browser storage state: {ex}")
+
+
+# parsed config.yml keyed by path -> (mtime_ns, size, dict). load_config is
+# called once per scrape, so batch runs re-parse an unchanged file over and
+# over without this; a stat call replaces the read+parse on hits
+_CONFIG_CACHE: dict = {}
+_CONFIG_LOCK = threading.Lock()
+
+
+def _read_config(path: str = "config.yml") -> dict:
+    """Returns the parsed config file, re-reading it only when it changed"""
+    st = os.stat(path)
+    with _CONFIG_LOCK:
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        with open(path, "r") as file:
+            config = yaml.safe_load(file)
+        _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
+        logger.info("config.yml file loaded")
+        return config
+
+
+# run timestamp used in output paths, stamped once per process. Re-stamping
+# it per load_config call fragments a concurrent scrape_many run: an entity
+# that started earlier would resolve its output dir with a later worker's
+# timestamp mid-run
+_RUN_TS = None
+
+
 def load_config():
     """Loads config.yml containing output directory and stop_critera (where to stop scrolling)"""
-    global LOCAL_OUTPUT_PATH
+    global LOCAL_OUTPUT_PATH, _RUN_TS
     try:
-        with open("config.yml", "r") as file:
-            config = yaml.safe_load(file)
-            LOCAL_OUTPUT_PATH = LOCAL_OUTPUT_PATH.format(
-                output_dir=config["google_output_dir"], entity_name="{entity_name}"
-            )
-            logger.info("config.yml file loaded")
+        config = _read_config()
+        with _CONFIG_LOCK:
+            if _RUN_TS is None:
+                _RUN_TS = os.environ.get("job_id") or str(datetime.now())
+        LOCAL_OUTPUT_PATH = _OUTPUT_PATH_TEMPLATE.format(
+            output_dir=config["google_output_dir"],
+            entity_name="{entity_name}",
+            run_ts=_RUN_TS,
+        )
     except Exception as ex:
         tb = traceback.format_exc()
         logger.info(f"Unable to use config.yml. {tb}")
@@ -58,12 +388,19 @@ def configure_queue_logger(log_queue):
     root_logger.addHandler(queue_handler)
 
 
+# set once _get_logger has installed its handlers; repeated calls (one per
+# execute_* invocation) must not stack duplicates on the root logger
+_ROOT_LOGGER_READY = False
+
+
 def _get_logger():
+    global _ROOT_LOGGER_READY
+    if _ROOT_LOGGER_READY:
+        return
+
     if not os.path.isdir("logs"):
         os.mkdir("logs")
 
-    # Create a file handler
-    file_path = f"logs/{DT}.log"
     frmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     logger = logging.getLogger()
@@ -75,14 +412,24 @@ def _get_logger():
     console_formatter = logging.Formatter(frmt)
     console_handler.setFormatter(console_formatter)
 
-    # Log to file
-    file_handler = logging.FileHandler(file_path)
+    # Log to a single rotating file instead of one timestamped file per run
+    # (the old f"logs/{DT}.log" name contained spaces and colons). Records
+    # are buffered through a MemoryHandler so a storm of per-review parse
+    # errors is flushed to disk in batches of 100 instead of one formatted
+    # write per record
+    file_handler = RotatingFileHandler(
+        "logs/scrape.log", maxBytes=5_000_000, backupCount=5
+    )
     file_handler.setLevel(logging.INFO)
     file_formatter = logging.Formatter(frmt)
     file_handler.setFormatter(file_formatter)
+    buffered_handler = MemoryHandler(
+        capacity=100, flushLevel=logging.CRITICAL, target=file_handler
+    )
 
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_handler)
+    _ROOT_LOGGER_READY = True
 
 
 ##########################################################
@@ -90,78 +437,33 @@ def _get_logger():
 ##########################################################
 
 
-def _validate(text: str):
-    """
-    Removes multitples spaces and strips \n
+# open csv file handles keyed by path, kept alive across scroll windows.
+# scrape_many workers share these, so creation/close go through _DISK_LOCK
+_CSV_SINKS: dict = {}
+_DISK_LOCK = threading.Lock()
 
-    Args:
-        element: Beautiful Soap element
+# output directories already created this run; save_local_files runs once
+# per scroll window, so without this every window pays a stat syscall
+_CREATED_DIRS: set = set()
 
-    Returns:
-        string text extracted from element
-    """
-    if text:
-        text = re.sub(r"\s+", " ", text).strip(" \n")
-        if len(text):
-            return text
-
-    return None
-
-
-def transform_date(str_date: str) -> str:
-    """Transforms the humanized date to datetime (str)
 
-    for example:
-    If datetime right now is 10-20-2023 15:27:33
-
-        - just now   -->  10-20-2023 15:27:33
-
-        - a minute ago  -->   10-20-2023 15:26:33
-        - an hour ago
-        - a day ago
-        - a week ago
-        - a month ago
-        - a year ago
-
-        - 2 minutes ago
-        - 2 hours ago   -->   10-20-2023 13:27:38
-        - 2 Days ago
-        - 2 Weeks ago
-        - 2 Months ago
-        - 2 Years ago
+def close_local_files(entity_dir: Union[str, None] = None):
+    """Closes the review csv handles kept open across scroll windows.
 
     Args:
-        str_date: string  containing humanize date
-
-    Returns:
-        datetime string
+        entity_dir: when given, only sinks under this directory are closed.
+            Concurrent scrape_many workers must pass their own entity dir so
+            finishing one entity does not close handles another entity is
+            still writing through; no argument closes everything
     """
-
-    if "now" in str_date:
-        return str(datetime.now().strftime("%m-%d-%Y %H:%M:%S"))
-
-    re_plural = r"(\d+).*(minutes\b|hours\b|days\b|weeks\b|months\b|years\b)"
-    re_singular = r"minute\b|hour\b|day\b|week\b|month\b|year\b"
-
-    try:
-        if re.search(re_plural, str_date):
-            for match in re.findall(re_plural, str_date):
-                # e.g ('2', 'minutes') 2 will be 'unit_value' and 'minutes' will be unit
-                unit_value = int(match[0])
-                unit = match[1]
-                dt = datetime.now() - relativedelta(**{unit: unit_value})
-                return dt.strftime("%m-%d-%Y %H:%M:%S")
-
-        if re.search(re_singular, str_date):
-            for unit in re.findall(re_singular, str_date):
-                # relativedelta does not support singular to we append 's' with the unit here
-                dt = datetime.now() - relativedelta(**{f"{unit}s": 1})
-                return dt.strftime("%m-%d-%Y %H:%M:%S")
-
-    except Exception as ex:
-        logger.error(ex)
-
-    return None
+    with _DISK_LOCK:
+        for fname in list(_CSV_SINKS):
+            if entity_dir is not None and not fname.startswith(f"{entity_dir}/"):
+                continue
+            try:
+                _CSV_SINKS.pop(fname)["file"].close()
+            except Exception as ex:
+                logger.error(ex)
 
 
 def save_local_files(
@@ -186,8 +488,10 @@ def save_local_files(
 
     dir_path = LOCAL_OUTPUT_PATH.format(entity_name=entity_name)
 
-    if not os.path.exists(dir_path) and (entitiy_metadata or ls_reviews):
-        os.makedirs(dir_path)
+    if dir_path not in _CREATED_DIRS and (entitiy_metadata or ls_reviews):
+        with _DISK_LOCK:
+            os.makedirs(dir_path, exist_ok=True)
+            _CREATED_DIRS.add(dir_path)
 
     fname1 = f"{dir_path}/metadata.csv"
     fname2 = f"{dir_path}/reviews_{sort_by}.csv"
@@ -200,36 +504,43 @@ def save_local_files(
                 writer.writerow(entitiy_metadata.values())
                 logger.info(f"Saved File: {fname1}")
 
-            except Exception as ex:
-                logger.error(ex)
-                pickle.dump(entitiy_metadata, file)
+            except Exception:
+                logger.exception(f"CSV write failed for {fname1}")
 
     if ls_reviews:
-        write_header = True
-        if os.path.exists(fname2):
-            write_header = False
+        # The reviews file is appended to once per scroll window; keep one
+        # open handle + writer per file for the lifetime of the scrape
+        # instead of an open/close cycle per batch
+        with _DISK_LOCK:
+            sink = _CSV_SINKS.get(fname2)
+            if sink is None:
+                sink = {
+                    "file": open(fname2, "a", newline=""),
+                    "needs_header": os.path.getsize(fname2) == 0,
+                }
+                sink["writer"] = csv.writer(sink["file"])
+                _CSV_SINKS[fname2] = sink
 
-        with open(fname2, "a", newline="") as file:
-            try:
-                writer = csv.writer(file)
-                if write_header:
-                    writer.writerow(ls_reviews[0].keys())
-                for row in ls_reviews:
-                    writer.writerow(row.values())
+        try:
+            if sink["needs_header"]:
+                sink["writer"].writerow(ls_reviews[0].keys())
+                sink["needs_header"] = False
+            sink["writer"].writerows(row.values() for row in ls_reviews)
 
-            except Exception as ex:
-                logger.error(ex)
-                pickle.dump(entitiy_metadata, file)
+        except Exception:
+            logger.exception(f"CSV write failed for {fname2}")
 
 
 def save_html(html: str, name: str = "", dir: str = ""):
     """Save html file for debugging purpose"""
     try:
+        # per-call timestamp so successive dumps do not overwrite each other
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         path = None
         if dir:
-            path = f"{dir}/{DT}_{name}.html"
+            path = f"{dir}/{ts}_{name}.html"
         else:
-            path = f"{DT}_{name}.html"
+            path = f"{ts}_{name}.html"
 
         with open(path, "w") as f:
             f.write(html)
@@ -270,14 +581,16 @@ def full_scrn_extract_overall_rating(page: Page) -> dict:
         rating = float(txt.split(" out of ")[0])
         n_reviews = int(re.sub("\s|reviews|\,|\.", "", txt.split(" from ")[1]))
 
-    get_star_rating = (
-        lambda star: page.locator(
-            f"//div[contains(@aria-label, '{star}-star reviews') and @role='text']"
-        )
-        .first.get_attribute("aria-label", timeout=50000)
-        .split("-star reviews ")[1]
-        .replace(" percent.", "")
-    )
+    # one evaluate() returns all five aria-labels instead of five
+    # sequential locator round-trips
+    star_labels: dict = page.evaluate(_JS_STAR_RATINGS)
+
+    def get_star_rating(star: str):
+        # e.g. '5-star reviews 60 percent.'
+        txt = star_labels.get(star)
+        if txt is None:
+            return None
+        return txt.split("-star reviews ")[1].replace(" percent.", "")
 
     return {
         "rating": rating,
@@ -324,182 +637,6 @@ def dialog_box_extract_overall_rating(page: Page) -> dict:
     }
 
 
-def full_scrn_parse_review_rating_tags(
-    ls_text: list,
-) -> dict:
-    """Parses the review and extracts text and rating tags and manager/entity response.
-
-    Args:
-        text: review text that can contain both user feedback and rating tags
-
-    Returns:
-        dict containing review text, english and original version, rating tags
-        owner response text and owner response time
-
-    Example:
-    =========
-    "The hotel offers a rich and tasty breakfast buffet. The staff is extremely courteous
-    and friendly. At the reception Samia was very helpful and super professional.
-    Rooms
-    4.0
-    Service
-    5.0
-    Location
-    3.0
-    Hotel highlights
-    Quiet · Kid-friendly · Great value
-    +8
-    Response from the owner
-    10 hours ago
-    Dear Nabil Q,
-    Thank you for taking the time to share your positive feedback.
-    We are delighted to learn that you had a wonderful stay and were pleased with the services provided by our team members.
-    Your kind words serve as a great source of motivation for all of us as we strive to consistently deliver exceptional experiences.
-    I wish to welcome you again soon.
-
-    Kind Regards
-    Ismail Tepe
-
-    Front Office Manager
-    "
-
-    - The above example contains both user review text and rating tags.
-    - There can be cases where there is only review text or only rating tags
-    """
-
-    full_review = rating_tags = en_full_review = other_lang_text = owner_resp_time = (
-        owner_resp_text
-    ) = None
-
-    ls_text = [item for item in ls_text if len(item) > 0]
-
-    if ls_text:
-        # Check for manager/entity response
-        idx_owner = [
-            idx
-            for idx, ele in enumerate(ls_text)
-            if "Response from the owner".lower() in ele.lower()
-        ]
-        # if "Response from the owner".lower() in text.lower():
-        if idx_owner:
-            idx_owner = idx_owner[
-                0
-            ]  # get the idx of the list, where the manager response starts
-            ls_r = "\n".join(ls_text[idx_owner + 1 :]).strip("\n")
-            ls_text = ls_text[:idx_owner]
-
-            ls_r_text = ls_r.split("\n")
-            owner_resp_time = transform_date(ls_r_text[0])
-            owner_resp_text = " ".join(ls_r_text[1:])
-
-    # There can be cases where the ls_text contains only response and no review text or rating tags
-    # So at this stage the ls_text could be empty because the manager response has already been
-    # extracted So therefore is necessary to check the length of the ls_text again
-    if ls_text:
-        ls_text[0] = ls_text[0].replace("\n", " ")
-
-        # it contains both review text and rating tags
-        if len(ls_text) > 1:
-            if ls_text[0] not in [
-                "Rooms",
-                "Service",
-                "Location",
-                "Hotel highlights",
-                "Nearby activities",
-                "Safety",
-                "Walkability",
-                "Food & drinks",
-                "Noteworthy details",
-            ]:
-                # It means the first item in the list is the review text
-
-                full_review = ls_text[0]
-                rating_tags = (
-                    " ".join(ls_text[1:])
-                    .replace(
-                        ".0",
-                        ".0,",
-                    )
-                    .strip()
-                )
-
-            # it only contains rating tags
-            else:
-                full_review = None
-                rating_tags = (
-                    " ".join(ls_text)
-                    .replace(
-                        ".0",
-                        ".0,",
-                    )
-                    .strip()
-                )
-
-        # It only contains review text
-        else:
-            full_review = ls_text[0]
-            rating_tags = None
-
-    if full_review is not None:
-        if "(Original)" in full_review:
-            full_review_p2 = full_review.split("(Original)")
-            en_full_review = (
-                full_review_p2[0].replace("(Translated by Google)", "").strip()
-            )
-            other_lang_text = full_review_p2[1]
-        else:
-            en_full_review = full_review
-            other_lang_text = None
-            full_review = None
-
-    return {
-        "full_review": full_review,
-        "rating_tags": rating_tags,
-        "en_full_review": en_full_review,
-        "other_lang_text": other_lang_text,
-        "owner_resp_text": owner_resp_text,
-        "owner_resp_time": owner_resp_time,
-    }
-
-
-def dialog_box_parse_review_rating_tags(text: str) -> Tuple[str, Union[str, None]]:
-    """Seperates review text from the rating tags. If no rating tags are found
-    original string is returned back
-
-    Args:
-        text: review text to process
-    """
-
-    # There can be cases when the last of word of text and the rating tag have no space b/w them
-    # e.g. "Nice place you can rent for night or by monthRooms: 4/5  |  Service: 5/5  |  Location: 5/5"
-    # So add one space before each rating tag
-
-    text = text.replace("Rooms:", " Rooms:")
-    text = text.replace("Service:", " Service:")
-    text = text.replace("Location:", " Location:")
-    text = text.replace("Hotel highlights:", " Hotel highlights:")
-    text = text.replace("Nearby activities:", " Nearby activities:")
-    text = text.replace("Safety:", " Safety:")
-    text = text.replace("Walkability:", " Walkability:")
-    text = text.replace("Food & drinks:", " Food & drinks:")
-    text = text.replace("Noteworthy details:", " Noteworthy details:")
-
-    pattern = re.compile(r"(\w+:\s[\d]/5)")
-    match = pattern.search(text)  # Find the first match in the text
-
-    # If it contains rating tags
-    if match:
-        # Get the matched substring
-        split_substring = match.group(1)
-        split_by = re.escape(split_substring)
-        # Split the text based on the matched substring
-        split_text = re.split(split_by, text, maxsplit=1)
-        review, rating_tags = split_text[0], split_substring + split_text[1]
-        return review, rating_tags
-
-    return text, None
-
-
 def full_scrn_parse_review_objs(
     stop_criteria: StopCritera,
     review_objs: Locator,
@@ -517,189 +654,68 @@ def full_scrn_parse_review_objs(
         count of google review (that are posted on google.com)
     """
 
-    ls_reviews = []
     count_google_reviews = 0
 
     current_scroll_window: Locator = review_objs.locator(
         f"xpath=div[{scroll_iter_idx}]"
     ).first
 
-    # Iterate and parse all the review objects in the current scroll window
-    n_reviews = current_scroll_window.inner_text().count(
-        "/5"
-    ) + current_scroll_window.inner_text().count("/10")
-
-    for idx_review in range(1, n_reviews + 1):
-        try:
-            current_review_obj = None
-            xpath_review_obj = f"div[{idx_review}]"
-            if is_the_element_visible(
-                current_scroll_window, xpath_review_obj, timeout_ms=1000
-            ):
-                current_review_obj: Locator = current_scroll_window.locator(
-                    f"xpath={xpath_review_obj}"
-                ).first
-            else:
-                continue
-
-            name = user_profile = rating = None
-
-            # *************START: Review Posted on Google*************
-
-            if current_review_obj.locator(
-                "xpath=" + "div[1]/div/span/a"
-            ).first.is_visible(timeout=1000):
-                # If the review is posted on google
-
-                # name of review poster
-                name = current_review_obj.locator(
-                    "xpath=" + "div[1]/div/span/a"
-                ).first.inner_text()
-
-                # google profile of the reviewer
-                user_profile = current_review_obj.locator(
-                    "xpath=" + "div[1]/div/span/a"
-                ).first.get_attribute("href")
-
-                # overall rating out of 5
-                rating = current_review_obj.locator(
-                    "xpath="
-                    + '//div[contains(., "/5")][not(.//div[contains(., "/5")])]'
-                ).first.inner_text()
-
-                if "/5" not in rating:
-                    rating = current_review_obj.locator(
-                        "xpath=" + 'div/div[2][contains(., "/5")]'
-                    ).first.inner_text()
-
-                # ************* --------END-------- *************
+    # Iterate and parse all the review objects in the current scroll window.
+    # Counting the child divs in the DOM returns a single integer over CDP,
+    # instead of serializing the whole window subtree with inner_text() just
+    # to count "/5" / "/10" occurrences on the Python side
+    n_reviews = current_scroll_window.locator("xpath=div").count()
 
-            else:
-                # *************START: Review Posted on any other site*************
+    # pre-sized so parsed reviews are assigned by index; slots left None by
+    # skipped/failed reviews are filtered out on return
+    ls_reviews: List[Union[dict, None]] = [None] * n_reviews
 
-                # If the review is fetch from other website e.g priceline
-                name = current_review_obj.locator(
-                    "xpath=" + "div[1]/div/span/span[1]"
-                ).first.inner_text()
-
-                user_profile = None
-                usre_profile_locator = current_review_obj.locator(
-                    "xpath=" + "div[1]/div/span/span[2]/a"
-                ).first
-                if usre_profile_locator.is_visible(timeout=1000):
-                    user_profile = current_review_obj.locator(
-                        "xpath=" + "div[1]/div/span/span[2]/a"
-                    ).first.get_attribute("href")
-
-                # overall rating out of 10
-                rating = current_review_obj.locator(
-                    "xpath="
-                    + '//div[contains(., "/10")][not(.//div[contains(., "/10")])]'
-                ).first.inner_text()
+    # the stop-criteria strings never change inside the loop, so they are
+    # normalized once here instead of once per review card
+    stop_user = stop_text = None
+    if stop_criteria is not None:
+        stop_user = _RE_WS.sub("", stop_criteria.username.lower())
+        stop_text = _RE_WS.sub("", stop_criteria.review_text.lower())[:50]
 
-                if "/10" not in rating:
-                    rating = current_review_obj.locator(
-                        "xpath=" + 'div/div[2][contains(., "/10")]'
-                    ).first.inner_text()
+    # one clock read shared by every date normalization in this window
+    now = datetime.now()
 
-                # ************* --------END-------- *************
-
-            # review text
-            review_text: list = current_review_obj.locator(
-                "xpath="
-                + 'div[2]//span[normalize-space() != "Business" and normalize-space() != "Vacation" and normalize-space() != "Family" and normalize-space() != "Friends" and normalize-space() != "Couple" and normalize-space() != "Solo" and not(contains(., " ❘ ")) and not(contains(., "Read more")) and not(contains(., "Report review")) and not(.//svg) ][not(.//span/span)] | div[2]//p[not(contains(., " ❘ ")) and not(contains(., "Read more")) and not(contains(., "Report review")) and not(.//svg)][not(.//p/span)]'
-            ).all_inner_texts()
+    for idx_review in range(1, n_reviews + 1):
+        try:
+            # the review divs are already attached at this point, so a plain
+            # count() probe (no timeout wait) is enough to skip missing ones
+            current_review_obj: Locator = current_scroll_window.locator(
+                f"xpath=div[{idx_review}]"
+            ).first
+            if not current_review_obj.count():
+                continue
 
-            # parse the current review text which also contains room/service/location tags
-            parsed_review_text: dict = full_scrn_parse_review_rating_tags(review_text)
+            # One evaluate() round-trip fetches every raw field of the review
+            # (name, profile, rating, texts, date, stay type, image urls)
+            raw_review: dict = current_review_obj.evaluate(_JS_EXTRACT_REVIEW)
 
-            if stop_criteria is not None:
-                stop_user = re.sub(r"\s", "", stop_criteria.username.lower())
-                stop_text = re.sub(r"\s", "", stop_criteria.review_text.lower())
-                target = re.sub(r"\s", "", current_review_obj.inner_text().lower())
-                if stop_user in target and stop_text[:50] in target:
+            if stop_user is not None:
+                target = _RE_WS.sub("", raw_review["full_text"].lower())
+                if stop_user in target and stop_text in target:
                     logger.info(f"Stopping critera met")
-                    return ls_reviews, True, count_google_reviews
+                    return [r for r in ls_reviews if r is not None], True, count_google_reviews
 
-            # date when review was posted
-            date = review_site = None
-            dt_locator = current_review_obj.locator(
-                "xpath="
-                + "//span[contains(., 'ago on')][not(.//span[contains(., 'ago on')])]"
-            ).first
-            if dt_locator.is_visible(timeout=100):
-                dt = dt_locator.inner_text()
-                dt = dt.split("ago on")
-                date = dt[0].strip()
-                review_site = dt[1].strip()  # eg google agoda priceline
-            else:
-                dt_locator = current_review_obj.locator(
-                    "xpath="
-                    + "//span[contains(., ' ago')][not(.//span[contains(., ' ago')])]"
-                ).first
-                date = dt_locator.inner_text()
-
-            if review_site:
-                if review_site.lower().strip() == "google":
-                    count_google_reviews += 1
-
-            date1 = transform_date(date)
-
-            # type of stay eg "Holiday ❘ Family"
-            stay_type = None
-            stay_type_locator = current_review_obj.locator(
-                "xpath=" + "div[2]/div/span"
-            ).first
-            if stay_type_locator.is_visible(timeout=100):
-                stay_type = stay_type_locator.inner_text(timeout=100)
-
-            review_images = None
-            path_review_imgs = "div[2]//img[contains(@alt, 'Photo')]"
-
-            if current_review_obj.locator("xpath=" + path_review_imgs).first.is_visible(
-                timeout=100
-            ):
-                ls_review_imgs = [
-                    (
-                        img.get_attribute("src")
-                        if img.get_attribute("src")
-                        else img.get_attribute("data-src")
-                    )
-                    for img in current_review_obj.locator(
-                        "xpath=" + path_review_imgs
-                    ).all()
-                ]
-                review_images = ", ".join(ls_review_imgs)
-
-                # Setting the resolution of images to 800x800
-                subst = "w800-h800"
-                regex = r"w[\d]+-h[\d]+-k-no-p"
-                res = re.sub(regex, subst, review_images, 0, re.MULTILINE)
-                if res:
-                    review_images = res
+            # all string manipulation lives in core.parsing so the hot loop
+            # here is just RPC + assignment
+            parsed_review_text: dict = parse_review_blob(raw_review, now)
 
-            rating, total_rating = rating.split("/")
-            parsed_review_text.update(
-                {
-                    "username": name,
-                    "user_profile": user_profile,
-                    "date": date,
-                    "review_post_date": date1,
-                    "review_site": review_site,
-                    "rating": rating,
-                    "total_rating_score": total_rating,
-                    "stay_type": stay_type,
-                    "review_images": review_images,
-                }
-            )
-            ls_reviews.append(parsed_review_text)
+            review_site = parsed_review_text["review_site"]
+            if review_site and review_site.lower().strip() == "google":
+                count_google_reviews += 1
+
+            ls_reviews[idx_review - 1] = parsed_review_text
         except Exception as ex:
             tb = traceback.format_exc()
             logger.error(
                 f"Unable to scrape review. Scroll window: {scroll_iter_idx}  Review_idx: {idx_review}\n{tb}"
             )
 
-    return ls_reviews, False, count_google_reviews
+    return [r for r in ls_reviews if r is not None], False, count_google_reviews
 
 
 def dialog_box_parse_review_objs(
@@ -738,75 +754,32 @@ def dialog_box_parse_review_objs(
             stay_type, review, rating_tags
         """
 
-        xpath_stay_type = xpath_review = None
         stay_type = review_text = rating_tags = None
-        review_sections = current_review_locator.locator(
-            f"{xpath_review_div}/div"
-        ).all()
 
         try:
-            # If it has three child divs
-            # It means stay_type is present along with the review text
-
-            if len(review_sections) > 2:
-                if len(
-                    current_review_locator.locator(
-                        f"{xpath_review_div}/div[2]/span/span/span"
-                    ).all()
-                ):
-                    xpath_review = f"{xpath_review_div}/div[2]/span/span/span"
-                elif len(
-                    current_review_locator.locator(
-                        f"{xpath_review_div}/div[2]/span/span"
-                    ).all()
-                ):
-                    xpath_review = f"{xpath_review_div}/div[2]/span/span"
-
-                xpath_stay_type = f"{xpath_review_div}/div[1]"
-
-            elif len(review_sections) > 1:
-                # If div[1]/div[3]/div/div/ has two child divs
-                # Either it only has review text and not stay_type
-                # Or it has stay_type and not review text
-                if len(
-                    current_review_locator.locator(
-                        f"{xpath_review_div}/div[1]/span/span/span"
-                    ).all()
-                ):
-                    xpath_review = f"{xpath_review_div}/div[1]/span/span/span"
-
-                elif len(
-                    current_review_locator.locator(
-                        f"{xpath_review_div}/div[1]/span/span"
-                    ).all()
-                ):
-                    xpath_review = (
-                        f"{xpath_review_div}/div[1]/span/span"  # to get review text
-                    )
-                else:
-                    xpath_stay_type = f"{xpath_review_div}/div[1]"  # to get Stay type because review text is not found
-                    xpath_review = None
+            # One evaluate() walks the section subtree in-page and resolves
+            # which layout we are in (three child divs mean stay_type is
+            # present along with the review text, two mean either review
+            # text or stay_type alone), instead of probing each candidate
+            # XPath with its own .all() round-trip
+            raw = current_review_locator.evaluate(
+                _JS_REVIEW_SECTIONS, xpath_review_div.replace("xpath=", "", 1)
+            )
 
-            else:
+            if raw["n_sections"] <= 1:
                 # There is no text in the review
                 logger.info(
                     f"No review text found window: {scroll_iter_idx}  Idx: {idx_review}"
                 )
 
-            if xpath_stay_type:
+            if raw["stay_type"] is not None:
                 # type of stay eg "Holiday ❘ Family"
-                stay_type = _validate(
-                    current_review_locator.locator(xpath_stay_type).first.text_content()
-                )
-
-            if xpath_review:
-                raw_review = current_review_locator.locator(
-                    xpath_review
-                ).first.text_content()
+                stay_type = _validate(raw["stay_type"])
 
+            if raw["review"] is not None:
                 # seperate review text from the rating tags
                 review_text, rating_tags = dialog_box_parse_review_rating_tags(
-                    raw_review
+                    raw["review"]
                 )
 
                 review_text = _validate(review_text)
@@ -825,17 +798,31 @@ def dialog_box_parse_review_objs(
     # *************End: Nested Method *************
     # *********************************************
 
-    ls_reviews = []
     count_google_reviews = 0
 
     current_scroll_window: Locator = review_objs.locator(
         f"xpath=div[{scroll_iter_idx}]"
     ).first
 
-    # Iterate and parse all the review objects in the current scroll window
-    n_reviews = current_scroll_window.inner_text().count(
-        "/5"
-    ) + current_scroll_window.inner_text().count("/10")
+    # Iterate and parse all the review objects in the current scroll window.
+    # Counting the child divs in the DOM returns a single integer over CDP,
+    # instead of serializing the whole window subtree with inner_text() just
+    # to count "/5" / "/10" occurrences on the Python side
+    n_reviews = current_scroll_window.locator("xpath=div").count()
+
+    # pre-sized so parsed reviews are assigned by index; slots left None by
+    # skipped/failed reviews are filtered out on return
+    ls_reviews: List[Union[dict, None]] = [None] * n_reviews
+
+    # the stop-criteria strings never change inside the loop, so they are
+    # normalized once here instead of once per review card
+    stop_user = stop_text = None
+    if stop_criteria is not None:
+        stop_user = _RE_WS.sub("", stop_criteria.username.lower())
+        stop_text = _RE_WS.sub("", stop_criteria.review_text.lower())[:50]
+
+    # one clock read shared by every date normalization in this window
+    now = datetime.now()
 
     for idx_review in range(1, n_reviews + 1):
         try:
@@ -852,54 +839,43 @@ def dialog_box_parse_review_objs(
 
             # *************START: Review Posted on Google*************
 
-            if current_review_obj.locator("xpath=" + "div[1]").first.is_visible():
+            if current_review_obj.locator(_XPATH_GOOGLE_MARKER).first.is_visible():
                 # If the review is posted on google
 
-                # name of review poster
-                name = current_review_obj.locator(
-                    "xpath=" + "div[1]/div/div/a"
-                ).first.inner_text()
-
-                # google profile of the reviewer
-                user_profile = current_review_obj.locator(
-                    "xpath=" + "div[1]/div/div/a"
-                ).first.get_attribute("href")
+                # name of review poster and google profile of the reviewer
+                # come off the same anchor, so resolve its locator once
+                name_loc = current_review_obj.locator(_XPATH_NAME_GOOGLE).first
+                name = name_loc.inner_text()
+                user_profile = name_loc.get_attribute("href")
 
                 # overall rating out of 5
                 rating = current_review_obj.locator(
-                    "xpath=" + "div[1]/span"
+                    _XPATH_RATING_GOOGLE
                 ).first.inner_text()
 
                 # If div[1]/div[3]/div/div/ has three child divs
                 # It means stay_type is present along with the review
 
-                xpath_review_secs = "xpath=div[1]/div[3]/div/div[1]"
                 stay_type, en_full_review, rating_tags = review_rating_stay_type(
-                    xpath_review_secs, current_review_obj
+                    _XPATH_REVIEW_SECS, current_review_obj
                 )
 
                 # Get the review in original language,
-                xpath_review_secs2 = "xpath=div[1]/div[3]/div/div[2]"
                 _, other_lang_text, _ = review_rating_stay_type(
-                    xpath_review_secs2, current_review_obj
+                    _XPATH_REVIEW_SECS_ORIG, current_review_obj
                 )
 
-                # date when review was posted
-                dt_locator = current_review_obj.locator(
-                    "xpath="
-                    + "//span[contains(., 'ago on')][not(.//span[contains(., 'ago on')])]"
-                ).first
-                if dt_locator.is_visible(timeout=100):
-                    dt = _validate(dt_locator.inner_text())
+                # date when review was posted. The general ' ago' query
+                # matches the span whether or not it carries the 'on <site>'
+                # suffix, so one lookup replaces the probe + second query
+                dt_locator = current_review_obj.locator(_XPATH_DATE_AGO).first
+                dt = _validate(dt_locator.inner_text())
+                if dt and "ago on" in dt:
                     dt = dt.split("ago on")
                     date = dt[0].strip()
                     review_site = dt[1].strip()  # eg google agoda priceline
                 else:
-                    dt_locator = current_review_obj.locator(
-                        "xpath="
-                        + "//span[contains(., ' ago')][not(.//span[contains(., ' ago')])]"
-                    ).first
-                    date = _validate(dt_locator.inner_text())
+                    date = dt
 
                 if review_site:
                     if review_site.lower().strip() == "google":
@@ -909,61 +885,59 @@ def dialog_box_parse_review_objs(
                 # div[4] otherise its div[3]
                 xpath_owner_response = None
 
-                if current_review_obj.locator(
-                    "xpath=div[2]/g-scrolling-carousel"
-                ).first.is_visible():
-                    ls_review_imgs = [
-                        img.get_attribute("style")
-                        .replace("background-image:url(", "")
-                        .replace(")", "")
-                        for img in current_review_obj.locator(
-                            "xpath=div[2]/g-scrolling-carousel//div[@aria-label = 'Photos']"
-                        ).all()
-                        if img.get_attribute("style")
-                    ]
+                carousel = current_review_obj.locator(_XPATH_CAROUSEL).first
+                if carousel.is_visible():
+                    # one evaluate_all round-trip returns every photo's style
+                    # attribute, instead of .all() plus one get_attribute RPC
+                    # per image
+                    ls_styles = carousel.locator(_XPATH_PHOTOS).evaluate_all(
+                        'els => els.map(e => e.getAttribute("style"))'
+                    )
+                    ls_review_imgs = []
+                    for style in ls_styles:
+                        if not style:
+                            continue
+                        # one slice instead of two full-string replaces
+                        if style.startswith(_BG_URL_PREFIX) and style.endswith(")"):
+                            url = style[len(_BG_URL_PREFIX) : -1]
+                        else:
+                            url = style
+                        # Setting the resolution of images to 800x800. Only
+                        # URLs that still carry the suffix need the regex
+                        if url.endswith("-p-n-k-no"):
+                            url = _RE_IMG_RES_DIALOG.sub("w800-h800", url)
+                        ls_review_imgs.append(url)
                     review_images = ", ".join(ls_review_imgs)
 
-                    # Setting the resolution of images to 800x800
-                    subst = "w800-h800"
-                    regex = r"w[\d]+-h[\d]+-p-n-k-no"
-                    res = re.sub(regex, subst, review_images, 0, re.MULTILINE)
-                    if res:
-                        review_images = res
-
                     xpath_owner_response = "xpath=div[4]"
 
                 else:
                     xpath_owner_response = "xpath=div[3]"
 
-                # check if owner response is available
+                # check if owner response is available. The container is
+                # resolved to an element handle once; the sub-queries below
+                # then run against the handle instead of re-walking the DOM
+                # from current_review_obj for every field
                 xpath_owner_response = f"{xpath_owner_response}/div/div/div[1]"
-                if current_review_obj.locator(xpath_owner_response).first.is_visible():
+                owner_loc = current_review_obj.locator(xpath_owner_response).first
+                if owner_loc.is_visible():
+                    owner_el = owner_loc.element_handle()
                     owner_resp_time = _validate(
-                        current_review_obj.locator(
-                            f"{xpath_owner_response}/div[1]"
-                        ).first.text_content()
+                        owner_el.query_selector("xpath=div[1]").text_content()
                     )
                     owner_resp_time = owner_resp_time.split("Response from the owner")[
                         -1
                     ].strip()
 
-                    # Check response is expandable with "More"
-                    if len(
-                        current_review_obj.locator(
-                            f"{xpath_owner_response}/div[2]/span[2]"
-                        ).all()
-                    ):
-                        owner_resp_text = _validate(
-                            current_review_obj.locator(
-                                f"{xpath_owner_response}/div[2]/span[2]"
-                            ).first.text_content()
-                        )
+                    # Check response is expandable with "More". One
+                    # query_selector probe replaces the .all() + re-query pair
+                    more_el = owner_el.query_selector("xpath=div[2]/span[2]")
+                    if more_el is not None:
+                        owner_resp_text = _validate(more_el.text_content())
 
                     else:  # Or it simply a short
                         owner_resp_text = _validate(
-                            current_review_obj.locator(
-                                f"{xpath_owner_response}/div[2]"
-                            ).first.text_content()
+                            owner_el.query_selector("xpath=div[2]").text_content()
                         )
 
                 # ************* --------END-------- *************
@@ -971,38 +945,37 @@ def dialog_box_parse_review_objs(
             else:
                 # *************START: Review Posted on any other site*************
                 name = current_review_obj.locator(
-                    "xpath=" + "a/div[1]/span[1]"
+                    _XPATH_NAME_OTHER
                 ).first.inner_text()
 
-                dt_locator = current_review_obj.locator(
-                    "xpath=" + "a/div[1]/span[2]"
-                ).first
+                dt_locator = current_review_obj.locator(_XPATH_DATE_OTHER).first
 
                 dt = _validate(dt_locator.inner_text())
                 dt = dt.split("ago on")
                 date = dt[0].strip()
 
-                rating = current_review_obj.locator("xpath=a/span").first.text_content()
+                rating = current_review_obj.locator(
+                    _XPATH_RATING_OTHER
+                ).first.text_content()
                 rating = _validate(rating)
 
                 en_full_review = current_review_obj.locator(
-                    "xpath=a/div[2]"
+                    _XPATH_REVIEW_OTHER
                 ).first.text_content()
                 other_lang_text = en_full_review
 
                 review_site = "other"
                 # ************* --------END-------- *************
 
-            date1 = transform_date(date)
+            date1 = transform_date(date, now)
             rating, total_rating = rating.split("/")
 
-            if stop_criteria is not None:
-                stop_user = re.sub(r"\s", "", stop_criteria.username.lower())
-                stop_text = re.sub(r"\s", "", stop_criteria.review_text.lower())
-                target = re.sub(r"\s", "", current_review_obj.inner_text().lower())
-                if stop_user in target and stop_text[:50] in target:
+            if stop_user is not None:
+                # the inner_text RPC is only paid when a stop criterion is set
+                target = _RE_WS.sub("", current_review_obj.inner_text().lower())
+                if stop_user in target and stop_text in target:
                     logger.info(f"Stopping critera met")
-                    return ls_reviews, True, count_google_reviews
+                    return [r for r in ls_reviews if r is not None], True, count_google_reviews
 
             result_obj = {
                 "full_review": full_review,
@@ -1022,7 +995,7 @@ def dialog_box_parse_review_objs(
                 "review_images": review_images,
             }
 
-            ls_reviews.append(result_obj)
+            ls_reviews[idx_review - 1] = result_obj
 
         except Exception as ex:
             tb = traceback.format_exc()
@@ -1030,10 +1003,12 @@ def dialog_box_parse_review_objs(
                 f"Unable to scrape review. Scroll window: {scroll_iter_idx}  Review_idx: {idx_review}\n{tb}"
             )
 
-    return ls_reviews, False, count_google_reviews
+    return [r for r in ls_reviews if r is not None], False, count_google_reviews
 
 
-def new_reviews_arrived(review_objs: Locator, scroll_iter_idx: int) -> bool:
+def new_reviews_arrived(
+    review_objs: Locator, scroll_iter_idx: int, timeout_ms: int = 5000
+) -> bool:
     """Check the availability of new review by comparing the hash of the object with
     the previous hash value
 
@@ -1044,10 +1019,56 @@ def new_reviews_arrived(review_objs: Locator, scroll_iter_idx: int) -> bool:
     Returns:
         in case of new review:  (True, new hash)  otherwise (False, previous hash value)
     """
-    if is_the_element_visible(review_objs, f"div[{scroll_iter_idx}]", state="attached"):
+    # fast path: one count() RPC answers in milliseconds when the window is
+    # already attached, without arming any wait at all
+    if review_objs.locator("xpath=div").count() >= scroll_iter_idx:
         return True
-    else:
-        return False
+
+    # otherwise give the freshly triggered batch a bounded window to attach;
+    # the wait returns the moment the div appears, and the callers retry
+    # several times on a miss
+    return is_the_element_visible(
+        review_objs, f"div[{scroll_iter_idx}]", state="attached", timeout_ms=timeout_ms
+    )
+
+
+def _first_window_text(review_objs: Locator) -> Union[str, None]:
+    """Text snapshot of the first review window, None when it is not there yet"""
+    try:
+        return review_objs.locator("xpath=div[1]").first.inner_text(timeout=3000)
+    except Exception:
+        return None
+
+
+def _wait_for_resort(
+    review_objs: Locator, before_text: Union[str, None], timeout_ms: int = 5000
+):
+    """Blocks until the first review window re-renders after a sort click.
+
+    The pre-sort div[1] stays attached while the re-sorted list loads, so
+    new_reviews_arrived's count() fast path would let the scroll loop parse
+    window 1 in the old order (duplicating/missing reviews once the
+    re-sorted list lands). Polls the window text against the snapshot taken
+    before the click and returns as soon as it differs; the bounded timeout
+    covers the case where the clicked sort was already active and nothing
+    re-renders.
+
+    Args:
+        review_objs: Locator containing review objects
+        before_text: _first_window_text() snapshot taken before the click
+    """
+    if before_text is None:
+        return
+    first_window = review_objs.locator("xpath=div[1]").first
+    deadline = time.monotonic() + timeout_ms / 1000
+    while time.monotonic() < deadline:
+        try:
+            if first_window.inner_text(timeout=1000) != before_text:
+                return
+        except Exception:
+            # the old node detaching mid-read also means the refresh started
+            return
+        time.sleep(0.1)
 
 
 ##########################################################
@@ -1088,52 +1109,53 @@ def reviews_in_full_screen(
 
     # _ = input("overall_rating Extracted")
 
-    page.wait_for_timeout(10000)
+    # wait for the review toolbar itself rather than a fixed 10s pause; the
+    # sort listbox is the next element this flow has to touch anyway
+    loc_sort_options = page.locator(
+        '//div[@role="listbox" and @aria-expanded="false" and @aria-label="Review Sort Options"]'
+    ).first
+    loc_sort_options.wait_for(state="attached", timeout=15000)
 
     # Select filter reviews by 'Google'. Discard reviews from other sources eg Tripadvisor
     xpath_review_src = '//div[@role="listbox" and @aria-expanded="false" and @aria-label="Review Source Options"]'
-    if is_the_element_visible(page, xpath_review_src):
+    # pure existence check: the listbox is either already on the page or not
+    # there at all, so don't sit out the default 30s timeout when it's absent
+    if is_the_element_visible(page, xpath_review_src, timeout_ms=3000):
         page.locator(xpath_review_src).first.click()
 
-        time.sleep(5)
-
+        # click() auto-waits for the option to become actionable
         page.locator(
             '//div[@data-value="-1" and @aria-label="Google" and @role="option"]'
         ).first.click()
 
-    # Click the "sort by" option
-
-    page.locator(
-        '//div[@role="listbox" and @aria-expanded="false" and @aria-label="Review Sort Options"]'
-    ).first.click()
-
-    time.sleep(5)
-
-    if input_params.sort_by == "most_helpful":
-        page.locator(
-            '//div[@data-value="1" and @aria-selected="true" and @aria-label="Most helpful" and @role="option"]'
-        ).first.click()
+    locator_review_objs = page.locator(
+        '//c-wiz[@data-node-index="0;0" and @c-wiz and @jscontroller and @jsaction and @decode-data-ved="1"]/div/div'
+    ).first
 
-    elif input_params.sort_by == "most_recent":
-        page.locator(
-            '//div[@data-value="2" and @aria-selected="false" and @aria-label="Most recent" and @role="option"]'
-        ).first.click()
+    # snapshot the first window before re-sorting; _wait_for_resort below
+    # uses it as the refresh barrier
+    before_sort_text = _first_window_text(locator_review_objs)
 
-    elif input_params.sort_by == "highest_score":
-        page.locator(
-            '//div[@data-value="3" and @aria-selected="false" and @aria-label="Highest score" and @role="option"]'
-        ).first.click()
+    # Click the "sort by" option
 
-    elif input_params.sort_by == "lowest_score":
-        page.locator(
-            '//div[@data-value="4" and @aria-selected="false" and @aria-label="Lowest score" and @role="option"]'
-        ).first.click()
+    loc_sort_options.click()
 
-    else:
+    sort_opt = _SORT_OPTS_FULL.get(input_params.sort_by)
+    if sort_opt is None:
         err = f"Invalid sort by option: {input_params.sort_by}. It must be any of these options: [most_helpful, most_recent, highest_score, lowest_score]"
         logger.error(err)
         raise Exception(err)
 
+    data_value, aria_selected, aria_label = sort_opt
+    page.locator(
+        f'//div[@data-value="{data_value}" and @aria-selected="{aria_selected}"'
+        f' and @aria-label="{aria_label}" and @role="option"]'
+    ).first.click()
+
+    # the old window 1 stays attached while the re-sorted list loads; do not
+    # enter the scroll loop until it has re-rendered
+    _wait_for_resort(locator_review_objs, before_sort_text)
+
     # *** Scrolling reviews ***
     # End scrolling if any one of the two conditions are met
     # 1. It has reached the end of reviews
@@ -1151,12 +1173,9 @@ def reviews_in_full_screen(
     iter_idx_scroll = 1  # scroll iteration index
     ls_reviews = []  # list of scraped reviews
     total_review = overall_rating["no_of_reviews"]
-    # divide by then because each div contains 10 review objects
-    total_review_divs = math.ceil(total_review / 10)
-
-    locator_review_objs = page.locator(
-        '//c-wiz[@data-node-index="0;0" and @c-wiz and @jscontroller and @jsaction and @decode-data-ved="1"]/div/div'
-    ).first
+    # divide by ten because each div contains 10 review objects. Integer
+    # ceiling division avoids the float round-trip of math.ceil
+    total_review_divs = -(-total_review // 10)
 
     stop_threahold = 5  # If new reviews are not found, then execution will stop
     stop_counter = 0
@@ -1166,8 +1185,9 @@ def reviews_in_full_screen(
         page.mouse.wheel(0, 10000)  # scroll to the end
         time.sleep(0.2)
         page.mouse.wheel(0, -200)  # scroll a little up, to load new reviews
-        time.sleep(2)
 
+        # no fixed sleep here: new_reviews_arrived blocks on an event-driven
+        # wait_for and returns as soon as the next window div attaches
         new_reviews_available = new_reviews_arrived(
             locator_review_objs, iter_idx_scroll
         )
@@ -1182,7 +1202,7 @@ def reviews_in_full_screen(
                 input_params.stop_critera, locator_review_objs, iter_idx_scroll
             )
             if isinstance(review_data, list):
-                ls_reviews += review_data
+                ls_reviews.extend(review_data)
                 count_google_reviews += c_google_reviews
                 count_all_reviews += len(review_data)
 
@@ -1249,33 +1269,35 @@ def reviews_in_dialog_box(
             entitiy_metadata=overall_rating,
         )
 
-    time.sleep(2)
+    locator_review_objs = page.locator(
+        '//div[@id="reviewSort" and @data-async-type="reviewSort"]'
+    ).first
+    # wait for the review container itself instead of a fixed 5s pause
+    locator_review_objs.wait_for(state="attached", timeout=15000)
+
+    # snapshot the first window before re-sorting; _wait_for_resort below
+    # uses it as the refresh barrier
+    before_sort_text = _first_window_text(locator_review_objs)
 
+    # click() auto-waits for the dropdown button to be actionable
     page.locator(
         '//g-dropdown-menu//div[@role="button" and @aria-expanded="false"]'
     ).first.click()
 
-    time.sleep(2)
-
     xpath_sort_item = "//g-menu[@role='menu']/g-menu-item[@role='menuitemradio' and div[text()= '{inner_text}'] ]"
 
-    if input_params.sort_by == "most_helpful":
-        page.locator(xpath_sort_item.format(inner_text="Most relevant")).first.click()
-
-    elif input_params.sort_by == "most_recent":
-        page.locator(xpath_sort_item.format(inner_text="Newest")).first.click()
-
-    elif input_params.sort_by == "highest_score":
-        page.locator(xpath_sort_item.format(inner_text="Highest rating")).first.click()
-
-    elif input_params.sort_by == "lowest_score":
-        page.locator(xpath_sort_item.format(inner_text="Lowest rating")).first.click()
-
-    else:
+    sort_label = _SORT_LABELS_DIALOG.get(input_params.sort_by)
+    if sort_label is None:
         err = f"Invalid sort by option: {input_params.sort_by}. It must be any of these options: [most_helpful, most_recent, highest_score, lowest_score]"
         logger.error(err)
         raise Exception(err)
 
+    page.locator(xpath_sort_item.format(inner_text=sort_label)).first.click()
+
+    # the old window 1 stays attached while the re-sorted list loads; do not
+    # enter the scroll loop until it has re-rendered
+    _wait_for_resort(locator_review_objs, before_sort_text)
+
     # *** Scrolling reviews ***
     # End scrolling if any one of the two conditions are met
     # 1. It has reached the end of reviews
@@ -1292,14 +1314,9 @@ def reviews_in_dialog_box(
     iter_idx_scroll = 1
     ls_reviews = []  # list of scraped reviews
     total_review = overall_rating["no_of_reviews"]
-    # divide by then because each div contains 10 review objects
-    total_review_divs = math.ceil(total_review / 10)
-
-    time.sleep(5)
-
-    locator_review_objs = page.locator(
-        '//div[@id="reviewSort" and @data-async-type="reviewSort"]'
-    ).first
+    # divide by ten because each div contains 10 review objects. Integer
+    # ceiling division avoids the float round-trip of math.ceil
+    total_review_divs = -(-total_review // 10)
 
     # It will scroll down 10 times. If new reviews (div) don't appear it means
     # It has reached the end of the reviews and there are no new review to appear
@@ -1309,9 +1326,10 @@ def reviews_in_dialog_box(
         page.mouse.wheel(0, 10000)  # scroll to the end
         time.sleep(0.2)
         page.mouse.wheel(0, -50)  # scroll a little up, to load new reviews
-        time.sleep(2)
 
-        # Check if you have reached the bottom of the page
+        # Check if you have reached the bottom of the page. No fixed sleep:
+        # new_reviews_arrived blocks on an event-driven wait_for and returns
+        # as soon as the next window div attaches
 
         new_reviews_available = new_reviews_arrived(
             locator_review_objs, iter_idx_scroll
@@ -1327,7 +1345,7 @@ def reviews_in_dialog_box(
                 input_params.stop_critera, locator_review_objs, iter_idx_scroll
             )
             if isinstance(review_data, list):
-                ls_reviews += review_data
+                ls_reviews.extend(review_data)
                 count_google_reviews += c_google_reviews
                 count_all_reviews += len(review_data)
 
@@ -1370,7 +1388,10 @@ def reviews_in_dialog_box(
 
 
 def execute_search_term_on_google(
-    playwright: Playwright, input_params: Input, my_logger: Union[Logger, None] = None
+    playwright: Playwright,
+    input_params: Input,
+    my_logger: Union[Logger, None] = None,
+    browser=None,
 ) -> Tuple[List[dict], dict]:
     """
 
@@ -1395,9 +1416,15 @@ def execute_search_term_on_google(
 
     t1 = time.time()
 
-    browser = playwright.chromium.launch(headless=False, args=["--start-maximized"])
+    # a caller-provided browser (see get_shared_browser) is reused and left
+    # open; otherwise one is launched and closed by this call
+    owns_browser = browser is None
+    if owns_browser:
+        browser = playwright.chromium.launch(
+            headless=False, args=["--start-maximized"]
+        )
 
-    context = browser.new_context()
+    context = _new_context(browser)
 
     # Open new page
     page = context.new_page()
@@ -1417,24 +1444,29 @@ def execute_search_term_on_google(
                 beepy.beep(sound=4)
                 break
 
-    time.sleep(2)
-
+    # fill() auto-waits for the search box, no fixed pause needed
     page.locator('//textarea[@aria-label="Search" or @aria-label="بحث"]').first.fill(
         input_params.place_name
     )
 
     page.keyboard.press("Enter")
 
-    time.sleep(5)
+    page.wait_for_load_state("domcontentloaded")
+
+    # Locator.is_visible ignores its timeout argument and returns
+    # immediately, which right after domcontentloaded is before the
+    # knowledge panel has rendered; these probes go through
+    # is_the_element_visible (locator.wait_for) so they actually block
+    # until the element is visible or the timeout expires
 
-    locator_eng_lan_button = page.locator("//a[contains(., 'Change to English')]").first
+    xpath_eng_lan_button = "//a[contains(., 'Change to English')]"
     # If the laguage is not English
-    logger.info(
-        "locator_eng_lan_button.is_visible()",
-        locator_eng_lan_button.is_visible(timeout=10000),
+    eng_button_visible = is_the_element_visible(
+        page, xpath_eng_lan_button, timeout_ms=5000
     )
-    if locator_eng_lan_button.is_visible(timeout=10000):
-        locator_eng_lan_button.click()
+    logger.info(f"locator_eng_lan_button visible: {eng_button_visible}")
+    if eng_button_visible:
+        page.locator(f"xpath={xpath_eng_lan_button}").first.click()
 
     # *** Check which review button is present ***
 
@@ -1443,30 +1475,30 @@ def execute_search_term_on_google(
 
     # *** Option 2: When the entity has fewer reviews e.g. less than 100***
     # Button like this is present: '50 Google reviews', '10 Google reviews'
-    # page.wait_for_load_state("networkidle", timeout=30000)
-    time.sleep(5)
 
-    button_type_1 = "xpath=//a[contains(@href, '/travel/search?') and span[text()='View all reviews']]"
-    button_type_2 = "xpath=//a[@data-is_owner='false' and @role='button' and span[contains(., ' Google reviews')]]"
+    button_type_1 = "//a[contains(@href, '/travel/search?') and span[text()='View all reviews']]"
+    button_type_2 = "//a[@data-is_owner='false' and @role='button' and span[contains(., ' Google reviews')]]"
 
     ls_reviews: List[dict] = []
     iter_idx_scroll = 0
     total_review_divs = 0
     overall_rating: dict = {}
     # Click reviews button
-    if page.locator(button_type_1).first.is_visible(timeout=10000):
+    if is_the_element_visible(page, button_type_1, timeout_ms=10000):
         logger.info("Reviews will be opened in a new screen")
-        page.locator(button_type_1).first.click(timeout=50000)
+        page.locator(f"xpath={button_type_1}").first.click(timeout=50000)
         ls_reviews, iter_idx_scroll, total_review_divs, overall_rating = (
             reviews_in_full_screen(page, input_params)
         )
-    elif page.locator(button_type_2).first.is_visible(timeout=10000):
+    elif is_the_element_visible(page, button_type_2, timeout_ms=10000):
         logger.info("Reviews will be opened in a dialog box in the same screen")
-        page.locator(button_type_2).first.click(timeout=50000)
+        page.locator(f"xpath={button_type_2}").first.click(timeout=50000)
         page.set_viewport_size({"width": 1200, "height": 800})
         ls_reviews, iter_idx_scroll, total_review_divs, overall_rating = (
             reviews_in_dialog_box(page, input_params)
         )
+    else:
+        logger.error("Unable to find any reviews button on the page")
 
     logger.info(
         f"Scrapping Complete   {len(ls_reviews)}   [Scroll_Window: {iter_idx_scroll}/{total_review_divs}]"
@@ -1474,15 +1506,25 @@ def execute_search_term_on_google(
 
     logger.info(f"Completed in {time.time()-t1}")
 
+    # close only this entity's csv handles; other entities may still be
+    # running in scrape_many worker threads
+    close_local_files(LOCAL_OUTPUT_PATH.format(entity_name=input_params.place_name))
+
+    _persist_storage_state(context)
+
     context.close()
 
-    browser.close()
+    if owns_browser:
+        browser.close()
 
     return ls_reviews, overall_rating
 
 
 def execute_visit_google_url(
-    playwright: Playwright, input_params: Input, my_logger: Union[Logger, None] = None
+    playwright: Playwright,
+    input_params: Input,
+    my_logger: Union[Logger, None] = None,
+    browser=None,
 ) -> Tuple[Union[None, List[dict]], Union[None, dict]]:
     """
 
@@ -1512,9 +1554,15 @@ def execute_visit_google_url(
 
     t1 = time.time()
 
-    browser = playwright.chromium.launch(headless=False, args=["--start-maximized"])
+    # a caller-provided browser (see get_shared_browser) is reused and left
+    # open; otherwise one is launched and closed by this call
+    owns_browser = browser is None
+    if owns_browser:
+        browser = playwright.chromium.launch(
+            headless=False, args=["--start-maximized"]
+        )
 
-    context = browser.new_context()
+    context = _new_context(browser)
 
     # Open new page
     page = context.new_page()
@@ -1529,7 +1577,6 @@ def execute_visit_google_url(
     )
     if is_the_element_visible(page, xpath_review_button):
         page.locator(f"xpath={xpath_review_button}").first.click(timeout=90000)
-        time.sleep(2)
 
         ls_reviews, iter_idx_scroll, total_review_divs, overall_rating = (
             reviews_in_full_screen(page, input_params)
@@ -1537,8 +1584,15 @@ def execute_visit_google_url(
     else:
         logger.error("Unable to find/click the Reviews button")
 
+    # close only this entity's csv handles; other entities may still be
+    # running in scrape_many worker threads
+    close_local_files(LOCAL_OUTPUT_PATH.format(entity_name=input_params.place_name))
+
+    _persist_storage_state(context)
+
     context.close()
-    browser.close()
+    if owns_browser:
+        browser.close()
 
     logger.info(
         f"Scrapping Complete   {len(ls_reviews)}   [Scroll_Window: {iter_idx_scroll}/{total_review_divs}]"
@@ -1546,3 +1600,42 @@ def execute_visit_google_url(
 
     logger.info(f"Completed in {time.time()-t1}")
     return ls_reviews, overall_rating
+
+
+def scrape_many(
+    ls_input_params: List[Input],
+    max_parallel: int = 3,
+    my_logger: Union[Logger, None] = None,
+) -> List[Tuple[List[dict], dict]]:
+    """Scrapes multiple entities in parallel with a bounded worker pool.
+
+    The per-entity work is I/O-bound (browser round-trips, page loads,
+    scrolling waits), so overlapping entities hides most of that latency.
+    Every worker thread runs its own Playwright instance because the sync
+    API objects must not be shared across threads.
+
+    Args:
+        ls_input_params: one Input per entity to scrape
+        max_parallel: maximum number of entities scraped at the same time
+        my_logger: optional logger passed through to the per-entity methods
+
+    Returns:
+        list of (reviews, overall_rating) tuples in the order of the inputs
+    """
+
+    # resolve the logger once so every worker passes the same instance; the
+    # executors assign it to the module-level 'logger', and per-worker
+    # _get_logger() calls would both race that global and stack duplicate
+    # handlers on the root logger
+    if my_logger is None:
+        _get_logger()
+        my_logger = logging.getLogger()
+
+    def _scrape_one(input_params: Input) -> Tuple[List[dict], dict]:
+        with sync_playwright() as playwright:
+            if len(input_params.google_page_url):
+                return execute_visit_google_url(playwright, input_params, my_logger)
+            return execute_search_term_on_google(playwright, input_params, my_logger)
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        return list(pool.map(_scrape_one, ls_input_params))
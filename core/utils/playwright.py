@@ -7,7 +7,7 @@ from playwright.sync_api import Locator, Page
 
 def is_the_element_visible(
     page: Union[Page, Locator],
-    xpath: str,
+    xpath: Union[str, None] = None,
     state: str = "visible",
     timeout_ms: int = 30000,
     logger: Union[Logger, None] = None,
@@ -15,7 +15,8 @@ def is_the_element_visible(
     """Waits for the element to be visible.
 
     Args:
-        page: Current page
+        page: Current page, or an already-resolved Locator (then xpath is
+            not needed and no selector re-parsing happens)
         xpath: path of the target element
 
     Returns:
@@ -26,11 +27,11 @@ def is_the_element_visible(
 
         logger = logging.getLogger(__name__)
     try:
-        # Hotel address (from the overview on google travels page)
-        loc_address = page.locator(f"xpath={xpath}").first
-        loc_address.wait_for(
-            timeout=timeout_ms, state=state
-        )  # default timeout is 30 seconds
+        if xpath is None and isinstance(page, Locator):
+            loc = page
+        else:
+            loc = page.locator(f"xpath={xpath}").first
+        loc.wait_for(timeout=timeout_ms, state=state)  # default timeout is 30 seconds
         return True
     except TimeoutError as er:
         logger.warning(f"Element not visible: {er}")
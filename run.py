@@ -1,64 +1,27 @@
+import argparse
+import logging
 from logging import Logger
 from multiprocessing import Queue
 from typing import List, Tuple, Union
 
-import typer
-from core.data_models import Input
-from core.scrape import execute_search_term_on_google, execute_visit_google_url
-from playwright.sync_api import sync_playwright
-from typing_extensions import Annotated
+module_logger = logging.getLogger(__name__)
 
-app = typer.Typer()
 
-
-@app.command()
 def execute(
-    place_name: Annotated[
-        str, typer.Argument(default=..., help="Hotel/Place to seach on Google")
-    ],
-    sort_by: Annotated[
-        str,
-        typer.Argument(
-            help="Sort google review by most_helpful, most_recent, highest_score or lowest_score",
-            rich_help_panel="Secondary Arguments",
-        ),
-    ] = "most_recent",
-    n_reviews: Annotated[
-        int,
-        typer.Argument(
-            help="Number of reviews to scrape from the top. -1 means scrape all. The reviews will be scraped according to the 'sort_by' option",
-            rich_help_panel="Secondary Arguments",
-        ),
-    ] = -1,
-    stop_criteria_username: Annotated[
-        str,
-        typer.Option(
-            help="username of the review. Stop further scraping when review of this username is found",
-            rich_help_panel="Secondary Arguments",
-        ),
-    ] = None,
-    stop_criteria_review: Annotated[
-        str,
-        typer.Option(
-            help="Review text to find. Stop further scraping when given username and review is found",
-            rich_help_panel="Secondary Arguments",
-        ),
-    ] = None,
-    save_review_to_disk: Annotated[
-        bool,
-        typer.Argument(
-            help="Whehter to save reviews on the local disk or not",
-            rich_help_panel="Secondary Arguments",
-        ),
-    ] = True,
-    save_metadata_to_disk: Annotated[
-        bool,
-        typer.Argument(
-            help="Whehter to overall rating and metadata on the local disk or not",
-            rich_help_panel="Secondary Arguments",
-        ),
-    ] = True,
+    place_name: str,
+    sort_by: str = "most_recent",
+    n_reviews: int = -1,
+    stop_criteria_username: Union[str, None] = None,
+    stop_criteria_review: Union[str, None] = None,
+    save_review_to_disk: bool = True,
+    save_metadata_to_disk: bool = True,
 ):
+    """Scrapes a single place searched by name on Google"""
+    # imported here so that '--help' and argument errors do not pay the
+    # pydantic schema-build, Playwright and core.scrape import costs
+    from core.data_models import Input
+    from core.scrape import execute_search_term_on_google, get_shared_browser
+
     input_params = {
         "place_name": place_name,
         "sort_by": sort_by,
@@ -75,18 +38,44 @@ def execute(
 
         input_params["stop_critera"] = stop
 
-    input_obj = Input(**input_params)
+    input_obj = Input.from_untrusted(input_params)
     ls_reviews: List[dict] = []
     overall_rating: dict = {}
-    with sync_playwright() as playwright:
-        ls_reviews, overall_rating = execute_search_term_on_google(
-            playwright, input_obj
+    # the shared browser keeps the Playwright driver and Chromium alive for
+    # the process lifetime, so repeated calls skip both cold starts
+    ls_reviews, overall_rating = execute_search_term_on_google(
+        None, input_obj, browser=get_shared_browser()
+    )
+    print(f"Scrapping Complete: Total Reviews  {len(ls_reviews)}")
+
+
+def execute_batch(
+    terms_file: str,
+    sort_by: str = "most_recent",
+    n_reviews: int = -1,
+    max_parallel: int = 3,
+):
+    """Scrapes several places concurrently through core.scrape.scrape_many"""
+    from core.data_models import Input
+    from core.scrape import scrape_many
+
+    with open(terms_file, "r") as fh:
+        place_names = [line.strip() for line in fh if line.strip()]
+
+    ls_inputs = [
+        Input.from_untrusted(
+            {"place_name": name, "sort_by": sort_by, "n_reviews": n_reviews}
         )
-        print(f"Scrapping Complete: Total Reviews  {len(ls_reviews)}")
+        for name in place_names
+    ]
+
+    results = scrape_many(ls_inputs, max_parallel=max_parallel)
+    for name, (ls_reviews, _) in zip(place_names, results):
+        print(f"{name}: {len(ls_reviews)} reviews")
 
 
 def run_as_module(
-    place_name: str,
+    place_name: str = "",
     google_page_url: str = "",
     sort_by: str = "most_recent",
     n_reviews: int = -1,
@@ -94,6 +83,7 @@ def run_as_module(
     stop_cri_user: str = "",
     stop_cri_review: str = "",
     logger: Union[Logger, None] = None,
+    prevalidated=None,
 ) -> Tuple[List[dict], dict]:
     """To run the scrapper as module by third party code
 
@@ -102,47 +92,144 @@ def run_as_module(
         sort_by: sort the reviews by  [most_helpful, most_recent, highest_score or lowest_score]
         n_reviews: Number of reviews to scrape from the top. -1 means scrape all. The reviews will be scraped according to the 'sort_by' option
         save_to_disk: Whether to save both metadata and reviews to disk
+        prevalidated: an already-built Input instance; when given it is used
+            as-is and every other argument except 'logger' is ignored, so
+            callers holding a validated model pay no rebuild at all
     """
+    from core.data_models import Input
+    from core.scrape import (
+        execute_search_term_on_google,
+        execute_visit_google_url,
+        get_shared_browser,
+    )
+
     ls_res: List[dict] = []
     overall_rating: dict = {}
 
-    input_params = {
-        "place_name": place_name,
-        "google_page_url": google_page_url,
-        "sort_by": sort_by,
-        "n_reviews": n_reviews,
-        "save_review_to_disk": True if save_to_disk else False,
-        "save_metadata_to_disk": True if save_to_disk else False,
-    }
-
-    if stop_cri_user:
-        stop = {"username": stop_cri_user}
+    if prevalidated is not None:
+        input_obj = prevalidated
+        google_page_url = prevalidated.google_page_url
+    else:
+        input_params = {
+            "place_name": place_name,
+            "google_page_url": google_page_url,
+            "sort_by": sort_by,
+            "n_reviews": n_reviews,
+            "save_review_to_disk": save_to_disk,
+            "save_metadata_to_disk": save_to_disk,
+        }
+
+        if stop_cri_user:
+            stop = {"username": stop_cri_user}
+
+            if stop_cri_review:
+                stop["review_text"] = stop_cri_review
+
+            input_params["stop_critera"] = stop
+
+        # kwargs from third-party callers are raw external input: validate
+        # fully so bad values fail here, not mid-scrape after the browser
+        # work has been paid for
+        input_obj = Input.from_untrusted(input_params)
+    browser = get_shared_browser()
+    if len(google_page_url):
+        module_logger.info("Calling execute_visit_google_url")
+        ls_res, overall_rating = execute_visit_google_url(
+            None, input_obj, my_logger=logger, browser=browser
+        )
+    else:
+        module_logger.info("Calling execute_search_term_on_google")
+        ls_res, overall_rating = execute_search_term_on_google(
+            None, input_obj, my_logger=logger, browser=browser
+        )
 
-        if stop_cri_review:
-            stop["review_text"] = stop_cri_review
+    module_logger.info(f"Scrapping Complete: Total Reviews  {len(ls_res)}")
 
-        input_params["stop_critera"] = stop
+    return ls_res, overall_rating
 
-    input_obj = Input(**input_params)
-    with sync_playwright() as playwright:
-        if len(google_page_url):
-            print("Calling execute_visit_google_url")
-            ls_res, overall_rating = execute_visit_google_url(
-                playwright, input_obj, my_logger=logger
-            )
-        else:
-            print("Calling execute_search_term_on_google")
-            ls_res, overall_rating = execute_search_term_on_google(
-                playwright, input_obj, my_logger=logger
-            )
-
-        print(f"Scrapping Complete: Total Reviews  {len(ls_res)}")
 
-    return ls_res, overall_rating
+def _str2bool(value: str) -> bool:
+    return value.strip().lower() not in ("false", "0", "no")
+
+
+def main(argv: Union[List[str], None] = None):
+    parser = argparse.ArgumentParser(
+        description="Scrape Google reviews of a hotel/place"
+    )
+    parser.add_argument(
+        "place_name", nargs="?", help="Hotel/Place to seach on Google"
+    )
+    parser.add_argument(
+        "sort_by",
+        nargs="?",
+        default="most_recent",
+        help="Sort google review by most_helpful, most_recent, highest_score or lowest_score",
+    )
+    parser.add_argument(
+        "n_reviews",
+        nargs="?",
+        type=int,
+        default=-1,
+        help="Number of reviews to scrape from the top. -1 means scrape all. The reviews will be scraped according to the 'sort_by' option",
+    )
+    parser.add_argument(
+        "save_review_to_disk",
+        nargs="?",
+        type=_str2bool,
+        default=True,
+        help="Whehter to save reviews on the local disk or not",
+    )
+    parser.add_argument(
+        "save_metadata_to_disk",
+        nargs="?",
+        type=_str2bool,
+        default=True,
+        help="Whehter to overall rating and metadata on the local disk or not",
+    )
+    parser.add_argument(
+        "--stop-criteria-username",
+        default=None,
+        help="username of the review. Stop further scraping when review of this username is found",
+    )
+    parser.add_argument(
+        "--stop-criteria-review",
+        default=None,
+        help="Review text to find. Stop further scraping when given username and review is found",
+    )
+    parser.add_argument(
+        "--batch-file",
+        default=None,
+        help="Path of a text file with one place name per line. Scrapes them concurrently instead of 'place_name'",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=3,
+        help="Maximum number of places scraped at the same time in batch mode",
+    )
+    args = parser.parse_args(argv)
+
+    # no basicConfig here: core.scrape configures console + file logging on
+    # the root logger itself, and a second stderr handler would print every
+    # scrape log line twice
+
+    if args.batch_file:
+        execute_batch(args.batch_file, args.sort_by, args.n_reviews, args.max_parallel)
+        return
+
+    if not args.place_name:
+        parser.error("place_name is required unless --batch-file is given")
+
+    execute(
+        args.place_name,
+        args.sort_by,
+        args.n_reviews,
+        args.stop_criteria_username,
+        args.stop_criteria_review,
+        args.save_review_to_disk,
+        args.save_metadata_to_disk,
+    )
 
 
 if __name__ == "__main__":
-    typer.run(execute)
-    # run_as_module(
-    #     google_page_url="https://www.google.com/travel/search?q=all%20hotels%20in%20doha%2C%20qatar&g2lb=2502548%2C2503771%2C2503781%2C2504375%2C4258168%2C4284970%2C4291517%2C4597339%2C4814050%2C4874190%2C4893075%2C4924070%2C4965990%2C4969802%2C10207535%2C10208620%2C72277293%2C72298667%2C72302247%2C72313836%2C72317059%2C72406588%2C72412680%2C72414906%2C72421566%2C72430562%2C72440516%2C72442338%2C72458707%2C72466827%2C72470899%2C72471395&hl=en-PK&gl=pk&ssta=1&ts=CAESCgoCCAMKAggDEAAaTQovEi0yJTB4M2U0NWM1MzRmZmRjZTg3ZjoweDQ0ZDkzMTlmNzhjZmQ0YjE6BERvaGESGhIUCgcI6A8QARgOEgcI6A8QARgPGAEyAhAAKgcKBToDUEtS&qs=CAESBENEWT0yJkNoZ0k0cGF4MlBlQm9mYThBUm9MTDJjdk1YUm9jemQwZW1NUUFROAZCCQkJr3mcvWa-gEIJCc1CagK22cKNQgkJgGr6UZAGJfNIAA&ap=MAFoAQ&ictx=1&sa=X&ved=0CMcBEMr3BGoXChMIqMjUmsrTgwMVAAAAAB0AAAAAEEw",
-    # )
+    main()
@@ -3,73 +3,33 @@ import core.scrape as scrape
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
+# single clock snapshot shared by every case; transform_date accepts it as
+# its reference time, so expectations can be exact instead of stripping the
+# seconds to absorb execution-time drift
+NOW = datetime.now()
+
+
+def _ago(**kwargs) -> str:
+    return (NOW - relativedelta(**kwargs)).strftime("%m-%d-%Y %H:%M:%S")
+
 
 @pytest.mark.parametrize(
     "str_date, expected_result",
     [
-        ["just now", datetime.now().strftime("%m-%d-%Y %H:%M")],
-        [
-            "a minute ago",
-            (datetime.now() - relativedelta(**{"minutes": 1})).strftime(
-                "%m-%d-%Y %H:%M"
-            ),
-        ],
-        [
-            "an hour ago",
-            (datetime.now() - relativedelta(**{"hours": 1})).strftime("%m-%d-%Y %H:%M"),
-        ],
-        [
-            "a day ago",
-            (datetime.now() - relativedelta(**{"days": 1})).strftime("%m-%d-%Y %H:%M"),
-        ],
-        [
-            "a week ago",
-            (datetime.now() - relativedelta(**{"weeks": 1})).strftime("%m-%d-%Y %H:%M"),
-        ],
-        [
-            "a month ago",
-            (datetime.now() - relativedelta(**{"months": 1})).strftime(
-                "%m-%d-%Y %H:%M"
-            ),
-        ],
-        [
-            "a year ago",
-            (datetime.now() - relativedelta(**{"years": 1})).strftime("%m-%d-%Y %H:%M"),
-        ],
-        [
-            "2 minutes ago",
-            (datetime.now() - relativedelta(**{"minutes": 2})).strftime(
-                "%m-%d-%Y %H:%M"
-            ),
-        ],
-        [
-            "3 hours ago",
-            (datetime.now() - relativedelta(**{"hours": 3})).strftime("%m-%d-%Y %H:%M"),
-        ],
-        [
-            "2 days ago",
-            (datetime.now() - relativedelta(**{"days": 2})).strftime("%m-%d-%Y %H:%M"),
-        ],
-        [
-            "2 weeks ago",
-            (datetime.now() - relativedelta(**{"weeks": 2})).strftime("%m-%d-%Y %H:%M"),
-        ],
-        [
-            "5 months ago",
-            (datetime.now() - relativedelta(**{"months": 5})).strftime(
-                "%m-%d-%Y %H:%M"
-            ),
-        ],
-        [
-            "6 years ago",
-            (datetime.now() - relativedelta(**{"years": 6})).strftime("%m-%d-%Y %H:%M"),
-        ],
+        ["just now", NOW.strftime("%m-%d-%Y %H:%M:%S")],
+        ["a minute ago", _ago(minutes=1)],
+        ["an hour ago", _ago(hours=1)],
+        ["a day ago", _ago(days=1)],
+        ["a week ago", _ago(weeks=1)],
+        ["a month ago", _ago(months=1)],
+        ["a year ago", _ago(years=1)],
+        ["2 minutes ago", _ago(minutes=2)],
+        ["3 hours ago", _ago(hours=3)],
+        ["2 days ago", _ago(days=2)],
+        ["2 weeks ago", _ago(weeks=2)],
+        ["5 months ago", _ago(months=5)],
+        ["6 years ago", _ago(years=6)],
     ],
 )
 def test_transform_date(str_date: str, expected_result: str):
-    """Comapre the timestamps without the "Seconds" so that execution time does not make the tests fail."""
-    dt = datetime.strptime(
-        scrape.transform_date(str_date), "%m-%d-%Y %H:%M:%S"
-    )  # convert string to datetime object
-    dt = dt.strftime("%m-%d-%Y %H:%M")  # convert datetime object to requried format
-    assert dt == expected_result
+    assert scrape.transform_date(str_date, NOW) == expected_result